@@ -10,6 +10,7 @@ Module Attributes:
 (C) Copyright 2021 Jonathan Casey.  All Rights Reserved Worldwide.
 """
 import datetime as dt
+import functools
 import logging
 import operator
 
@@ -107,8 +108,13 @@ def get_net_include_section_gids(              # pylint: disable=too-many-locals
         **exclude_sect_gids_from_names,
     }
 
-    if include_gids - project_section_gids:
-        missing_gids = [str(g) for g in include_gids - project_section_gids]
+    # Each used to both check and report, so only compute once
+    missing_include_gids = include_gids - project_section_gids
+    missing_exclude_gids = exclude_gids - project_section_gids
+    conflicting_gids_set = include_gids & exclude_gids
+
+    if missing_include_gids:
+        missing_gids = [str(g) for g in missing_include_gids]
         missing_names = [gids_to_names[int(g)] for g in missing_gids
                 if int(g) in gids_to_names]
         err_msg = 'Section names/gids explicitly included are missing from' \
@@ -119,8 +125,8 @@ def get_net_include_section_gids(              # pylint: disable=too-many-locals
             err_msg += f' Also check names: `{"`, `".join(missing_names)}`.'
         raise DataMissingError(err_msg)
 
-    if exclude_gids - project_section_gids:
-        missing_gids = [str(g) for g in exclude_gids - project_section_gids]
+    if missing_exclude_gids:
+        missing_gids = [str(g) for g in missing_exclude_gids]
         missing_names = [gids_to_names[int(g)] for g in missing_gids
                 if int(g) in gids_to_names]
         warn_msg = 'Section names/gids explicitly excluded are missing from' \
@@ -131,8 +137,8 @@ def get_net_include_section_gids(              # pylint: disable=too-many-locals
             warn_msg += f' Also check names: `{"`, `".join(missing_names)}`.'
         logger.warning(warn_msg)
 
-    if include_gids & exclude_gids:
-        conflicting_gids = [str(g) for g in include_gids & exclude_gids]
+    if conflicting_gids_set:
+        conflicting_gids = [str(g) for g in conflicting_gids_set]
         conflicting_names = [gids_to_names[int(g)] for g in conflicting_gids
                 if int(g) in gids_to_names]
         err_msg = 'Explicit section names/gids cannot be simultaneously' \
@@ -315,33 +321,29 @@ def _filter_tasks_by_datetime(tasks, dt_base, rel_dt_until_due,
     if rel_dt_until_due is None:
         return tasks
 
+    # Since this is rel compare, format is `task [op] threshold`
     if utils.is_date_only(rel_dt_until_due):
-        ignore_time = True
+        # Date-only compare needs no per-task branching, so filter in one pass
         due_threshold = dt_base.date() + rel_dt_until_due
-    else:
-        ignore_time = False
-        due_threshold = dt_base + rel_dt_until_due
+        return [t for t in tasks if t['due_on'] is not None
+                and task_is_rel_comparison_success_op(
+                    _parse_due_on(t['due_on']), due_threshold)]
 
+    due_threshold = dt_base + rel_dt_until_due
     filt_tasks = []
     for task in tasks:
         if task['due_on'] is None:
             continue
-        if ignore_time:
-            due_task = dt.date.fromisoformat(task['due_on'])
+        if 'due_at' in task and task['due_at'] is not None:
+            due_task = _parse_due_at(task['due_at'])
+        elif time_due_assumed is not None:
+            # Use due date, but assume the "time" and tz as provided
+            due_task = dt.datetime.combine(_parse_due_on(task['due_on']),
+                    time_due_assumed, dt_base.tzinfo)
         else:
-            if 'due_at' in task and task['due_at'] is not None:
-                # Need dateutil since datetime does not handle ending in Z
-                due_task = dp.isoparse(task['due_at'])
-            elif time_due_assumed is not None:
-                # Use due date, but assume the "time" and tz as provided
-                due_task = dt.datetime.combine(
-                        dt.date.fromisoformat(task['due_on']),
-                        time_due_assumed, dt_base.tzinfo)
-            else:
-                # Based on provided config, date-only should be skipped here
-                continue
-
-        # Since this is rel compare, format is `task [op] threshold`
+            # Based on provided config, date-only should be skipped here
+            continue
+
         if task_is_rel_comparison_success_op(due_task, due_threshold):
             filt_tasks.append(task)
 
@@ -349,6 +351,53 @@ def _filter_tasks_by_datetime(tasks, dt_base, rel_dt_until_due,
 
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_due_on(due_on):
+    """
+    Parses the due date string of a task from the API.
+
+    Results are cached since the same tasks are usually filtered more than once
+    (e.g. by both the min and max until due), and since many tasks share the
+    same due dates.
+
+    Args:
+      due_on (str): The ISO 8601 due date string from the API.
+
+    Returns:
+      (date): The parsed due date.
+    """
+    return dt.date.fromisoformat(due_on)
+
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_due_at(due_at):
+    """
+    Parses the due datetime string of a task from the API.
+
+    Results are cached for the same reasons as `_parse_due_on()`.  This will try
+    the much faster `datetime.fromisoformat()` first, only falling back to
+    `dateutil` for strings it cannot parse.
+
+    Args:
+      due_at (str): The ISO 8601 due datetime string from the API.
+
+    Returns:
+      (datetime): The parsed due datetime.
+    """
+    try:
+        # Much faster than dateutil, but before python 3.11, datetime does not
+        #  handle ending in Z, so need to swap that for the equivalent offset
+        if due_at.endswith('Z'):
+            return dt.datetime.fromisoformat(due_at[:-1] + '+00:00')
+        return dt.datetime.fromisoformat(due_at)
+    except ValueError:
+        # Need dateutil for any other ISO 8601 formats datetime does not handle
+        #  (e.g. offsets without a colon before python 3.11)
+        return dp.isoparse(due_at)
+
+
+
 def _filter_tasks_by_completed(tasks, is_completed):
     """
     Filters tasks based on the completion status.
@@ -5,6 +5,15 @@ defined by the metaclass.
 
 Module Attributes:
   logger (Logger): Logger for this module.
+  ERR_UTL_AND_GID (str): Error message for giving both 'for my tasks list' and
+    a user task list gid.
+  ERR_PROJ_XOR_UTL (str): Error message for not giving exactly one of a
+    project or user task list.
+  ERR_NO_WORKSPACE (str): Error message for not giving a workspace.
+  ERR_TIME_UNTIL_PARSE (str): Error message for min/max time until due that
+    was given but could not be parsed.
+  ERR_TIME_UNTIL_XOR_NO_DUE (str): Error message for not giving exactly one of
+    min/max time until due or match no due date.
 
 (C) Copyright 2021 Jonathan Casey.  All Rights Reserved Worldwide.
 """
@@ -22,6 +31,15 @@ from asana_extensions.rules import rule_meta
 
 logger = logging.getLogger(__name__)
 
+ERR_UTL_AND_GID = "Cannot specify 'for my tasks list' and 'user task list" \
+        + " gid' together."
+ERR_PROJ_XOR_UTL = 'Must specify to use a project or user task list, but not' \
+        + ' both.'
+ERR_NO_WORKSPACE = 'Must specify workspace.'
+ERR_TIME_UNTIL_PARSE = 'Failed to parse min/max time until due -- check format.'
+ERR_TIME_UNTIL_XOR_NO_DUE = 'Must specify either min/max time until due or' \
+        + ' match no due date (but not both).'
+
 
 
 class MoveTasksRule(rule_meta.Rule):
@@ -62,26 +80,20 @@ class MoveTasksRule(rule_meta.Rule):
         is_project_given = rule_params['project_name'] is not None \
                 or rule_params['project_gid'] is not None
         assert rule_params['is_my_tasks_list'] is False \
-                or rule_params['user_task_list_gid'] is None, "Cannot" \
-                    + " specify 'for my tasks list' and 'user task list gid'" \
-                    + " together."
+                or rule_params['user_task_list_gid'] is None, ERR_UTL_AND_GID
         is_user_task_list_given = rule_params['is_my_tasks_list'] \
                 or rule_params['user_task_list_gid'] is not None
-        assert is_project_given ^ is_user_task_list_given, "Must specify to" \
-                + " use a project or user task list, but not both."
+        assert is_project_given ^ is_user_task_list_given, ERR_PROJ_XOR_UTL
         assert rule_params['workspace_name'] is not None \
-                or rule_params['workspace_gid'] is not None, "Must specify" \
-                    + " workspace."
+                or rule_params['workspace_gid'] is not None, ERR_NO_WORKSPACE
 
         is_time_given = rule_params['min_time_until_due_str'] is not None \
                 or rule_params['max_time_until_due_str'] is not None
         is_time_parsed = rule_params['min_time_until_due'] is not None \
                 or rule_params['max_time_until_due'] is not None
-        assert is_time_given == is_time_parsed, "Failed to parse min/max" \
-                + " time until due -- check format."
-        assert is_time_given ^ rule_params['match_no_due_date'], "Must" \
-                + " specify either min/max time until due or match no due" \
-                + " date (but not both)."
+        assert is_time_given == is_time_parsed, ERR_TIME_UNTIL_PARSE
+        assert is_time_given ^ rule_params['match_no_due_date'], \
+                ERR_TIME_UNTIL_XOR_NO_DUE
 
         self._rule_params = rule_params
 
@@ -12,6 +12,8 @@ name and path.
 
 Module Attributes:
   logger (Logger): Logger for this module.
+  _TIMEFRAME_TOKEN_PTN (Pattern): The pattern for each number and timeframe
+    indicator pair that could be in a timeframe string.
 
 (C) Copyright 2021 Jonathan Casey.  All Rights Reserved Worldwide.
 """
@@ -19,7 +21,6 @@ from abc import ABC, abstractmethod
 import datetime as dt
 import logging
 import re
-import string
 
 from dateutil.relativedelta import relativedelta
 
@@ -30,6 +31,16 @@ from asana_extensions.general.exceptions import *   # pylint: disable=wildcard-i
 
 logger = logging.getLogger(__name__)
 
+# Pattern is generally:
+#   Start of line; or whitespace, letter, or comma (look behind)
+#   Possible plus/neg sign and definitely digits
+#   Possible 1 whitespace
+#   Letters for the timeframe indicator (checked against each timeframe after)
+#   Whitespace, neg/plus sign, digit, comma, or end of line (without consuming)
+_TIMEFRAME_TOKEN_PTN = re.compile(r'(^|(?<=\s|[a-z]|[A-Z]|,))'
+        + r'(?P<num>(\+|-)?\d+)\s?(?P<unit>[a-zA-Z]+)(?=\s|-|\d|,|\+|$)',
+        re.MULTILINE)
+
 
 
 class Rule(ABC):
@@ -314,19 +325,14 @@ class Rule(ABC):
         if arg_str is None or arg_str == '':
             return None
 
-        kwargs = {}
-        kwargs['minutes'] = cls.parse_timeframe(arg_str,
-                {'minutes?': False, 'm': True})
-        kwargs['hours'] = cls.parse_timeframe(arg_str,
-                {'hours?': False, 'h': True})
-        kwargs['days'] = cls.parse_timeframe(arg_str,
-                {'days?': False, 'd': True})
-        kwargs['weeks'] = cls.parse_timeframe(arg_str,
-                {'weeks?': False, 'w': True})
-        kwargs['months'] = cls.parse_timeframe(arg_str,
-                {'months?': False, 'M': True})
-        kwargs['years'] = cls.parse_timeframe(arg_str,
-                {'years?': False, 'y': True})
+        kwargs = cls.parse_timeframes(arg_str, {
+            'minutes': {'minutes?': False, 'm': True},
+            'hours': {'hours?': False, 'h': True},
+            'days': {'days?': False, 'd': True},
+            'weeks': {'weeks?': False, 'w': True},
+            'months': {'months?': False, 'M': True},
+            'years': {'years?': False, 'y': True},
+        })
 
         return relativedelta(**kwargs)
 
@@ -337,12 +343,14 @@ class Rule(ABC):
         """
         Parses a specific timeframe indicator from a string.  A collection of
         possible ways that timeframe can be specified can be given in regex
-        format (must be string Template compatible).  Each can specify whether
-        case sensitive or not.
+        format.  Each can specify whether case sensitive or not.
 
         Exactly 1 match is expected.  If no matches, will return nothing; but
         more than 1 is considered an error condition.
 
+        See `parse_timeframes()` to parse several timeframes from the same
+        string at once.
+
         Args:
           tf_str (str): The string to search for timeframe indicators.
           timeframes ({str:bool}): Timeframe indicators to search in string,
@@ -356,38 +364,56 @@ class Rule(ABC):
         Raises:
           (TimeframeArgDupeError): More than 1 match found.
         """
-        # Pattern is generally:
-        #   Start of line; or whitespace, letter, or comma (look behind)
-        #   Possible plus/neg sign and definitely digits
-        #   Possible 1 whitespace
-        #   <letter or word> depending on time keyword, word could have s at end
-        #   Whitespace, neg/plus sign, digit, comma, or end of line
-        #         (without consuming)
-        # Note double $$ used for end of line since written as Template
-        ptn_template = string.Template(r'(^|(?<=\s|[a-z]|[A-Z]|,))'
-                + r'(?P<num>(\+|-)?\d+)\s?' + '$timeframe'
-                + r'(?=\s|-|\d|,|\+|$$)')
-
-        ptns = []
-        for timeframe, case_sensitive in timeframes.items():
-            regex_str = ptn_template.substitute(timeframe=timeframe)
-            if case_sensitive:
-                ptn = re.compile(regex_str, re.MULTILINE)
-            else:
-                ptn = re.compile(regex_str, re.MULTILINE | re.IGNORECASE)
-            ptns.append(ptn)
-
-        matches = []
-        for ptn in ptns:
-            matches.extend(ptn.finditer(tf_str))
-
-        if len(matches) == 0:
-            return 0
-
-        if len(matches) > 1:
-            '/'.join(timeframes.keys())
-            raise TimeframeArgDupeError('Could not parse time frame - Found'
-                    + f' {len(matches)} entries for'
-                    + f' {"/".join(timeframes.keys())} when only 0-1 allowed.')
-
-        return int(matches[0].group('num'))
+        return cls.parse_timeframes(tf_str, {None: timeframes})[None]
+
+
+
+    @classmethod
+    def parse_timeframes(cls, tf_str, timeframes_by_key):
+        """
+        Parses several specific timeframe indicators from a string, scanning the
+        string only once.  Each timeframe is specified the same way as for
+        `parse_timeframe()`, and the same rules apply to each.
+
+        The string is split into each number and the letters that follow it,
+        and then the letters are matched against each timeframe indicator in
+        full, so timeframe indicators can only match letters.
+
+        Args:
+          tf_str (str): The string to search for timeframe indicators.
+          timeframes_by_key ({any:{str:bool}}): The timeframe indicators to
+            search in string for each timeframe, keyed by any key that is to
+            be used to return the result for that timeframe.  See
+            `parse_timeframe()` for the format of the timeframe indicators.
+
+        Returns:
+          ({any:int}): The number specified with each timeframe if exactly 1
+            match found; 0 if no matches.  Keyed by the same keys as
+            `timeframes_by_key`.
+
+        Raises:
+          (TimeframeArgDupeError): More than 1 match found for any timeframe.
+            Timeframes are checked in the order of `timeframes_by_key`.
+        """
+        unit_ptns_by_key = {}
+        for key, timeframes in timeframes_by_key.items():
+            unit_ptns_by_key[key] = [
+                    re.compile(tf, 0 if case_sensitive else re.IGNORECASE)
+                    for tf, case_sensitive in timeframes.items()]
+
+        nums_by_key = {key: [] for key in timeframes_by_key}
+        for match in _TIMEFRAME_TOKEN_PTN.finditer(tf_str):
+            unit = match.group('unit')
+            for key, unit_ptns in unit_ptns_by_key.items():
+                nums_by_key[key].extend(int(match.group('num'))
+                        for ptn in unit_ptns if ptn.fullmatch(unit))
+
+        for key, nums in nums_by_key.items():
+            if len(nums) > 1:
+                tf_names = '/'.join(timeframes_by_key[key].keys())
+                raise TimeframeArgDupeError('Could not parse time frame - Found'
+                        + f' {len(nums)} entries for {tf_names} when only'
+                        + ' 0-1 allowed.')
+
+        return {key: nums[0] if nums else 0
+                for key, nums in nums_by_key.items()}
@@ -4,23 +4,242 @@ Configures pytest as needed.  This file normally does not need to exist, but is
 used here to share and configure items for the /tests/unit/asana subpackage.
 
 Module Attributes:
-  N/A
+  logger (Logger): Logger for this module.
+  _BATCH_MAX_ACTIONS (int): The max number of actions the asana batch API
+    accepts in a single request.
+  _DELETE_MAX_WORKERS (int): The max number of deletes to run concurrently,
+    which is kept within the concurrent write request limit of the API.  When
+    run with `pytest-xdist`, this is shared between all workers.
 
 (C) Copyright 2021 Jonathan Casey.  All Rights Reserved Worldwide.
 """
 # pylint: disable=protected-access # Allow for purpose of testing those elements
 
-import uuid
+import concurrent.futures
+import logging
+import os
+import secrets
 
+import asana
 import pytest
 
 from asana_extensions.asana import client as aclient
+from asana_extensions.general import config
+from tests.exceptions import *                 # pylint: disable=wildcard-import
 from tests.unit.asana import tester_data
 
 
 
+logger = logging.getLogger(__name__)
+
+_BATCH_MAX_ACTIONS = 10
+
+_DELETE_MAX_WORKERS = 15
+
+
+
+@pytest.fixture(name='delete_concurrently', scope='session')
+def fixture_delete_concurrently():
+    """
+    Returns a function that can be used to delete a list of test resources with
+    the API concurrently, which is intended for the teardown of fixtures that
+    created them.  Deletes of sibling resources are independent, so there is no
+    need to wait on each to complete before starting the next.
+
+    Any resource that is already deleted (e.g. by a test) is skipped with a
+    warning rather than failing the teardown.
+
+    When run with `pytest-xdist`, each worker has its own session and so its
+    own executor, so the max number of concurrent deletes is split between the
+    workers to keep the total within the limit of the API.
+    """
+    num_xdist_workers = int(os.environ.get('PYTEST_XDIST_WORKER_COUNT', 1))
+    max_workers = max(1, _DELETE_MAX_WORKERS // num_xdist_workers)
+
+    def safe_delete(delete_func, gid):
+        """
+        Deletes the resource, tolerating it already being deleted.
+        """
+        try:
+            delete_func(gid)
+        except asana.error.NotFoundError:
+            logger.warning(f'Could not delete gid {gid} -- already deleted')
+
+    def delete_concurrently(delete_func, data_list):
+        """
+        Deletes each of the resources in the data list concurrently, waiting
+        for all to complete.
+
+        Args:
+          delete_func (func): The asana client function that deletes a single
+            resource by gid (e.g. `client.tasks.delete_task`).
+          data_list ([{str:any}]): The list of data for the resources to delete,
+            each of which must have the 'gid' key.
+
+        Raises:
+          (asana.error.AsanaError): Any errors from the API other than the
+            resource already being deleted.
+        """
+        futures = [executor.submit(safe_delete, delete_func, d['gid'])
+                for d in data_list]
+        for future in futures:
+            future.result()
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers) as executor:
+        yield delete_concurrently
+
+
+
+@pytest.fixture(name='secrets_conf', scope='session')
+def fixture_secrets_conf():
+    """
+    Reads the real `.secrets.conf` once for the session so that tests that
+    monkeypatch `config.read_conf_file()` to force the client to be recreated
+    can still provide the real config without reading the file each time.
+    """
+    return config.read_conf_file('.secrets.conf')
+
+
+
+@pytest.fixture(name='asana_client', scope='session')
+def fixture_asana_client():
+    """
+    Gets the cached asana client so that fixtures needing the client can share
+    it rather than each resolving it independently.
+
+    This is the same client cached for the process by `aclient._get_client()`,
+    so it is left open for anything that still uses it after the tests.
+    """
+    return aclient._get_client()
+
+
+
+@pytest.fixture(name='send_batch_actions', scope='session')
+def fixture_send_batch_actions(asana_client):
+    """
+    Returns a function that can be used to send a list of actions to the API
+    with as few batch API requests as possible, which is intended for the setup
+    and teardown of fixtures that create or delete several sibling resources
+    where the order in which they are processed does not matter.
+
+    Note that each action still counts against the rate limits, but the round
+    trip overhead is only paid once per batch of up to `_BATCH_MAX_ACTIONS`.
+
+    The batch API returns one result per action, in the same order as the
+    actions.  Each result is a dict with the HTTP 'status_code' of the action
+    and the 'body' of its response, which (as for any other API request) has
+    the resource data under 'data' on success.
+
+    Since the actions in a batch succeed or fail independently, a batch can
+    partly succeed.  Any successful actions can be undone before the error is
+    raised so that a fixture that fails during setup (and so is never torn
+    down) does not leave any resources behind.
+    """
+    def send_batch_actions(actions, ignore_not_found=False, undo_action=None):
+        """
+        Sends the actions with the batch API, waiting for all to complete.
+
+        Args:
+          actions ([{str:any}]): The list of actions, each of which must have
+            the 'method' and 'relative_path' keys, and optionally the 'data'
+            key, as expected by the batch API.
+          ignore_not_found (bool): Whether any action that fails because the
+            resource was not found (e.g. already deleted by a test) should be
+            skipped with a warning rather than failing.
+          undo_action (func or None): A function that takes the `data` of a
+            successful action result and returns the action that undoes it
+            (e.g. deletes a created resource).  If provided and any action
+            fails, the successful actions are undone before raising.
+
+        Returns:
+          ([{str:any} or None]): The `data` element of the body of each action
+            result, in the same order as `actions`.  Any action skipped per
+            `ignore_not_found` will be None.
+
+        Raises:
+          (asana.error.AsanaError): Any errors from the API, including any
+            action in a batch that fails (other than those ignored).  All
+            failed actions are included in the message.
+        """
+        # pylint: disable=no-member     # asana.Client dynamically adds attrs
+        results = []
+        for i_start in range(0, len(actions), _BATCH_MAX_ACTIONS):
+            results.extend(asana_client.batch_api.create_batch_request({
+                'actions': actions[i_start:i_start + _BATCH_MAX_ACTIONS],
+            }))
+
+        data_list = []
+        fail_msgs = []
+        fail_status = None
+        for action, result in zip(actions, results):
+            action_desc = f'{action["method"]} {action["relative_path"]}'
+            if result['status_code'] == 404 and ignore_not_found:
+                logger.warning(f'Could not {action_desc} -- not found')
+                data_list.append(None)
+            elif result['status_code'] >= 400:
+                fail_msgs.append(f'{action_desc} failed: {result["body"]}')
+                fail_status = fail_status or result['status_code']
+                data_list.append(None)
+            else:
+                data_list.append(result['body']['data'])
+
+        if fail_msgs:
+            if undo_action is not None:
+                send_batch_actions([undo_action(d) for d in data_list
+                        if d is not None], ignore_not_found=True)
+            raise asana.error.AsanaError('Batch action(s) failed: '
+                    + '; '.join(fail_msgs), fail_status)
+        return data_list
+
+    return send_batch_actions
+
+
+
+@pytest.fixture(name='me_data', scope='session')
+def fixture_me_data():
+    """
+    Gets the data for the 'me' (self) user once for the session so that all
+    fixtures creating data owned by or assigned to 'me' can share it.
+
+    ** Consumes 1 API call. **
+    """
+    return aclient._get_me()
+
+
+
+@pytest.fixture(name='ws_gid', scope='session')
+def fixture_ws_gid():
+    """
+    Gets the gid of the test workspace once for the session so that all
+    fixtures creating data in the test workspace can share it.
+
+    Since every test that needs the asana account to be configured for testing
+    depends on this (directly or through other fixtures), this also serves as
+    the one-time check that it is.  Any failure here is cached by pytest for the
+    session, so the check is not repeated for each test.
+
+    ** Consumes at least 1 API call. **
+    (varies depending on data size, but only 1 call intended)
+
+    Raises:
+      (TesterNotInitializedError): If test workspace does not exist on asana
+        account tied to access token, will stop test.  User must create
+        manually per docs.
+    """
+    try:
+        return aclient.get_workspace_gid_from_name(tester_data._WORKSPACE)
+    except aclient.DataNotFoundError as ex:
+        # This is an error with the tester, not the module under test
+        raise TesterNotInitializedError('Cannot run unit tests: Must create a'
+                + f' workspace named "{tester_data._WORKSPACE}" in the asana'
+                + ' account tied to access token in .secrets.conf') from ex
+
+
+
 @pytest.fixture(name='sections_in_utl_test', scope='session')
-def fixture_sections_in_utl_test():
+def fixture_sections_in_utl_test(asana_client, me_data, ws_gid,
+        delete_concurrently):
     """
     Creates some test sections in the user task list (in the test workspace) and
     returns a list of them, each of which is the dict of data that should match
@@ -33,29 +252,26 @@ def fixture_sections_in_utl_test():
     without the need to needlessly create and delete this section.  (Also,
     could not figure out how to get rid of all syntax and pylint errors).
 
-    ** Consumes at least 7 API calls. **
-    (API call count is 2*num_sects + at least 3)
-    (varies depending on data size, but only 7 calls intended)
+    ** Consumes 5 API calls. **
+    (API call count is 2*num_sects + 1)
     """
     # pylint: disable=no-member     # asana.Client dynamically adds attrs
     num_sects = 2
-    client = aclient._get_client()
-    me_data = aclient._get_me()
-    ws_gid = aclient.get_workspace_gid_from_name(tester_data._WORKSPACE)
     utl_gid = str(aclient.get_user_task_list_gid(ws_gid, is_me=True))
 
+    sect_names = [tester_data._section_name(secrets.token_hex(8))
+            for _ in range(num_sects)]
+
     sect_data_list = []
-    for _ in range(num_sects):
-        sect_name = tester_data._SECTION_TEMPLATE.substitute(
-                {'sid': uuid.uuid4()})
+    for sect_name in sect_names:
         params = {
             'name': sect_name,
             'owner': me_data['gid'],
         }
-        sect_data = client.sections.create_section_for_project(utl_gid, params)
+        sect_data = asana_client.sections.create_section_for_project(utl_gid,
+                params)
         sect_data_list.append(sect_data)
 
     yield sect_data_list
 
-    for sect_data in sect_data_list:
-        client.sections.delete_section(sect_data['gid'])
+    delete_concurrently(asana_client.sections.delete_section, sect_data_list)
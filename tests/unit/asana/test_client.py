@@ -15,17 +15,21 @@ Module Attributes:
 # pylint: disable=protected-access # Allow for purpose of testing those elements
 # pylint: disable=too-many-lines
 
+import functools
 import logging
+import operator
+import os
+import secrets
+import subprocess
+import sys
 import types
-import uuid
-import warnings
 
 import asana
 import pytest
 
 from asana_extensions.asana import client as aclient
 from asana_extensions.general import config
-from tests.exceptions import *                 # pylint: disable=wildcard-import
+from asana_extensions.general import dirs
 from tests.unit.asana import tester_data
 
 
@@ -53,41 +57,124 @@ def fixture_raise_asana_error(request):
 
 
 
+@pytest.fixture(name='inject_asana_error')
+def fixture_inject_asana_error(monkeypatch, asana_client, raise_asana_error):
+    """
+    Returns a function that can be used to monkeypatch a method of the cached
+    client so that it raises an `AsanaError` sub-error.  Unless an exception
+    type is provided, this will be the marked one as provided by the
+    `raise_asana_error` fixture.
+
+    Need to monkeypatch cached client since class dynamically creates attrs.
+    Since `monkeypatch` is function-scoped, the attr is restored on the session
+    client at the end of each test that injects an error.
+    """
+    def inject(attr_path, exception_type=None):
+        """
+        Monkeypatches the attr of the cached client to raise the error.
+
+        Args:
+          attr_path (str): The dot-separated path to the attr of the client to
+            monkeypatch (e.g. 'workspaces.get_workspaces').
+          exception_type (AsanaError or None): The exception type to raise.  If
+            None, will use the one from the `raise_asana_error` fixture.
+        """
+        def mock_raise(*args, **kwargs):       # pylint: disable=unused-argument
+            """
+            Simply raise the desired error.
+            """
+            raise exception_type
+
+        obj_path, _, attr = attr_path.rpartition('.')
+        target = functools.reduce(getattr, obj_path.split('.'), asana_client)
+        monkeypatch.setattr(target, attr,
+                raise_asana_error if exception_type is None else mock_raise)
+
+    return inject
+
+
+
+def is_project_still_existing(asana_client, proj_data):
+    """
+    Checks whether the project still exists on the server with the same name,
+    such as when reusing a project cached from a previous test session.
+
+    Args:
+      asana_client (Client): The asana client to use to check the project.
+      proj_data ({str:any}): The data of the project to check.  Must have the
+        'gid' and 'name' keys.
+
+    Returns:
+      (bool): True if the project still exists with the same name; False
+        otherwise.
+    """
+    # pylint: disable=no-member     # asana.Client dynamically adds attrs
+    try:
+        found_proj_data = asana_client.projects.get_project(proj_data['gid'],
+                opt_fields=['name'])
+    except asana.error.NotFoundError:
+        return False
+    return found_proj_data['name'] == proj_data['name']
+
+
+
 @pytest.fixture(name='project_test', scope='session')
-def fixture_project_test():
+def fixture_project_test(request, asana_client, me_data, ws_gid,
+        delete_concurrently):
     """
     Creates a test project and returns the dict of data that should match the
     'data' element returned by the API.
 
     Will delete the project once done with all tests.
 
+    If the `--reuse-asana-fixtures` option is provided, the project will
+    instead be kept and cached so that following sessions with that option can
+    reuse it as long as it still exists, skipping both the creation and the
+    deletion.  When run with `pytest-xdist`, each worker has its own session
+    and so its own project, so the cache is keyed by worker id as well.
+
     This is not being used with the autouse keyword so that, if running tests
     that do not require this project fixture, they can run more optimally
     without the need to needlessly create and delete this project.  (Also,
     could not figure out how to get rid of all syntax and pylint errors).
 
-    ** Consumes 3 API calls. **
+    ** Consumes 2 API calls. **
+    (or 1 API call if reusing a cached project)
     """
     # pylint: disable=no-member     # asana.Client dynamically adds attrs
-    proj_name = tester_data._PROJECT_TEMPLATE.substitute({'pid': uuid.uuid4()})
-    client = aclient._get_client()
-    ws_gid = aclient.get_workspace_gid_from_name(tester_data._WORKSPACE)
-    me_data = aclient._get_me()
+    is_reuse = request.config.getoption('--reuse-asana-fixtures')
+    worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'master')
+    cache_key = f'asana_extensions/{me_data["gid"]}/{ws_gid}/{worker_id}' \
+            + '/project_test'
+    if is_reuse:
+        proj_data = request.config.cache.get(cache_key, None)
+        if proj_data is not None \
+                and is_project_still_existing(asana_client, proj_data):
+            yield proj_data
+            return
+
+    proj_name = tester_data._project_name(secrets.token_hex(8))
     params = {
         'name': proj_name,
         'owner': me_data['gid'],
     }
-    proj_data = client.projects.create_project_for_workspace(str(ws_gid),
-            params)
+    proj_data = asana_client.projects.create_project_for_workspace(
+            str(ws_gid), params)
+
+    if is_reuse:
+        request.config.cache.set(cache_key, proj_data)
+        yield proj_data
+        return
 
     yield proj_data
 
-    client.projects.delete_project(proj_data['gid'])
+    delete_concurrently(asana_client.projects.delete_project, [proj_data])
 
 
 
 @pytest.fixture(name='sections_in_project_test', scope='session')
-def fixture_sections_in_project_test(project_test):
+def fixture_sections_in_project_test(asana_client, me_data, project_test,
+        delete_concurrently):
     """
     Creates some test sections in the test project and returns a list of them,
     each of which is the dict of data that should match the `data` element
@@ -100,36 +187,34 @@ def fixture_sections_in_project_test(project_test):
     without the need to needlessly create and delete this section.  (Also,
     could not figure out how to get rid of all syntax and pylint errors).
 
-    ** Consumes 5 API calls. **
-    (API call count is 2*num_sects + 1)
+    ** Consumes 4 API calls. **
+    (API call count is 2*num_sects)
     """
     # pylint: disable=no-member     # asana.Client dynamically adds attrs
     num_sects = 2
-    client = aclient._get_client()
-    me_data = aclient._get_me()
+
+    sect_names = [tester_data._section_name(secrets.token_hex(8))
+            for _ in range(num_sects)]
 
     sect_data_list = []
-    for _ in range(num_sects):
-        sect_name = tester_data._SECTION_TEMPLATE.substitute(
-                {'sid': uuid.uuid4()})
+    for sect_name in sect_names:
         params = {
             'name': sect_name,
             'owner': me_data['gid'],
         }
-        sect_data = client.sections.create_section_for_project(
+        sect_data = asana_client.sections.create_section_for_project(
                 project_test['gid'], params)
         sect_data_list.append(sect_data)
 
     yield sect_data_list
 
-    for sect_data in sect_data_list:
-        client.sections.delete_section(sect_data['gid'])
+    delete_concurrently(asana_client.sections.delete_section, sect_data_list)
 
 
 
 @pytest.fixture(name='tasks_in_project_and_utl_test', scope='session')
-def fixture_tasks_in_project_and_utl_test(project_test,
-        sections_in_project_test, sections_in_utl_test):
+def fixture_tasks_in_project_and_utl_test(asana_client, me_data, project_test,
+        sections_in_project_test, sections_in_utl_test, delete_concurrently):
     """
     Creates some tasks in both the user task list (in the test workspace) and
     the test project, and returns a list of them, each of which is the dict of
@@ -146,17 +231,17 @@ def fixture_tasks_in_project_and_utl_test(project_test,
     without the need to needlessly create and delete this section.  (Also,
     could not figure out how to get rid of all syntax and pylint errors).
 
-    ** Consumes 7 API calls. **
-    (API call count is 3*num_sects + 1)
+    ** Consumes 6 API calls. **
+    (API call count is 3*num_tasks)
     """
     # pylint: disable=no-member     # asana.Client dynamically adds attrs
     num_tasks = 2
-    client = aclient._get_client()
-    me_data = aclient._get_me()
+
+    task_names = [tester_data._task_name(secrets.token_hex(8))
+            for _ in range(num_tasks)]
 
     task_data_list = []
-    for _ in range(num_tasks):
-        task_name = tester_data._TASK_TEMPLATE.substitute({'tid': uuid.uuid4()})
+    for task_name in task_names:
         params = {
             'assignee': me_data['gid'],
             'assignee_section': sections_in_utl_test[0]['gid'],
@@ -165,26 +250,26 @@ def fixture_tasks_in_project_and_utl_test(project_test,
                 project_test['gid'],
             ],
         }
-        task_data = client.tasks.create_task(params)
+        task_data = asana_client.tasks.create_task(params)
         task_data_list.append(task_data)
 
         # No way to add project section at task creation, so need separate call
         params = {
             'task': task_data['gid'],
         }
-        client.sections.add_task_for_section(sections_in_project_test[0]['gid'],
-                params)
+        asana_client.sections.add_task_for_section(
+                sections_in_project_test[0]['gid'], params)
 
     yield task_data_list
 
-    for task_data in task_data_list:
-        client.tasks.delete_task(task_data['gid'])
+    delete_concurrently(asana_client.tasks.delete_task, task_data_list)
 
 
 
 @pytest.fixture(name='tasks_movable_in_project_and_utl_test', scope='session')
-def fixture_tasks_movable_in_project_and_utl_test(project_test,
-        sections_in_project_test, sections_in_utl_test):
+def fixture_tasks_movable_in_project_and_utl_test(asana_client, me_data,
+        project_test, sections_in_project_test, sections_in_utl_test,
+        delete_concurrently):
     """
     Creates some tasks in both the user task list (in the test workspace) and
     the test project, and returns a list of them, each of which is the dict of
@@ -203,17 +288,17 @@ def fixture_tasks_movable_in_project_and_utl_test(project_test,
     without the need to needlessly create and delete this section.  (Also,
     could not figure out how to get rid of all syntax and pylint errors).
 
-    ** Consumes 7 API calls. **
-    (API call count is 3*num_sects + 1)
+    ** Consumes 9 API calls. **
+    (API call count is 3*num_tasks)
     """
     # pylint: disable=no-member     # asana.Client dynamically adds attrs
     num_tasks = 3
-    client = aclient._get_client()
-    me_data = aclient._get_me()
+
+    task_names = [tester_data._task_name(secrets.token_hex(8))
+            for _ in range(num_tasks)]
 
     task_data_list = []
-    for i_task in range(num_tasks):
-        task_name = tester_data._TASK_TEMPLATE.substitute({'tid': uuid.uuid4()})
+    for i_task, task_name in enumerate(task_names):
         i_sect = 0
         if i_task >= 2:
             i_sect = 1
@@ -225,20 +310,95 @@ def fixture_tasks_movable_in_project_and_utl_test(project_test,
                 project_test['gid'],
             ],
         }
-        task_data = client.tasks.create_task(params)
+        task_data = asana_client.tasks.create_task(params)
         task_data_list.append(task_data)
 
         # No way to add project section at task creation, so need separate call
         params = {
             'task': task_data['gid'],
         }
-        client.sections.add_task_for_section(
+        asana_client.sections.add_task_for_section(
                 sections_in_project_test[i_sect]['gid'], params)
 
     yield task_data_list
 
-    for task_data in task_data_list:
-        client.tasks.delete_task(task_data['gid'])
+    delete_concurrently(asana_client.tasks.delete_task, task_data_list)
+
+
+
+@pytest.fixture(name='tasks_in_project_and_utl_test_idx_by_gid',
+        scope='session')
+def fixture_tasks_in_project_and_utl_test_idx_by_gid(
+        tasks_in_project_and_utl_test):
+    """
+    Indexes the `tasks_in_project_and_utl_test` by gid once for the session so
+    it can be used directly by `filter_result_for_test()`.
+    """
+    return index_by_key(tasks_in_project_and_utl_test, 'gid')
+
+
+
+@pytest.fixture(name='tasks_movable_in_project_and_utl_test_idx_by_gid',
+        scope='session')
+def fixture_tasks_movable_in_project_and_utl_test_idx_by_gid(
+        tasks_movable_in_project_and_utl_test):
+    """
+    Indexes the `tasks_movable_in_project_and_utl_test` by gid once for the
+    session so it can be used directly by `filter_result_for_test()`.
+    """
+    return index_by_key(tasks_movable_in_project_and_utl_test, 'gid')
+
+
+
+@pytest.fixture(name='api_data_shapes_validated', scope='session')
+def fixture_api_data_shapes_validated(asana_client, ws_gid, project_test,
+        sections_in_project_test):     # pylint: disable=unused-argument
+    """
+    Validates once for the session that the data returned by the API for
+    workspaces, projects, and sections is in the format that
+    `_find_gid_from_name()` expects, so that the tests for the methods using
+    it can focus on their own behavior.
+
+    Only the first item of each is pulled from the API, which is all that is
+    needed to check the format.
+
+    ** Consumes at least 3 API calls. **
+    (varies depending on data size, but only 3 calls intended)
+    """
+    # pylint: disable=no-member     # asana.Client dynamically adds attrs
+    expected_keys = {'gid', 'name', 'resource_type'}
+
+    workspace = next(iter(asana_client.workspaces.get_workspaces()))
+    assert expected_keys <= workspace.keys()
+
+    project = next(iter(asana_client.projects.get_projects(
+            {'workspace': str(ws_gid)})))
+    assert expected_keys <= project.keys()
+
+    section = next(iter(asana_client.sections.get_sections_for_project(
+            project_test['gid'])))
+    assert expected_keys <= section.keys()
+
+
+
+def index_by_key(data, match_key):
+    """
+    Indexes the data by the value of the key in each item so the index of the
+    item with a given key value can be looked up directly.
+
+    Args:
+      data ([{str:any}]): The list of data to index.
+      match_key (str/int): The key to index by in each item of the `data`.
+
+    Returns:
+      idx_by_key ({any:int}): The index of the item in `data` for each value of
+        `match_key`.  If a key value is in multiple items, the first wins.
+    """
+    get_key = operator.itemgetter(match_key)
+    idx_by_key = {}
+    for i_item, item in enumerate(data):
+        idx_by_key.setdefault(get_key(item), i_item)
+    return idx_by_key
 
 
 
@@ -257,8 +417,11 @@ def filter_result_for_test(found_data, allowed_data, match_key,
       found_data ([{str:any}]): The list of data returned by the asana API for
         a query.  This is likely really a single-iteration generator, but either
         will be compatible.
-      allowed_data ([{str:any}]): The list of data that is "allowed" to be in
-        the `found_data`.  All other data in `found_data` will be excluded.
+      allowed_data ([{str:any}]/{any:int}): The list of data that is "allowed"
+        to be in the `found_data`.  All other data in `found_data` will be
+        excluded.  If filtering by the same data repeatedly, this can instead be
+        that data already indexed by `index_by_key()` with the same
+        `match_key`.
       match_key (str/int): The key to match in each item of the `found_data` and
         `allowed_data`.  Probably should be a string, but no reason it couldn't
         be an int if you know what you are doing.
@@ -274,20 +437,20 @@ def filter_result_for_test(found_data, allowed_data, match_key,
         would be the order provided by the API if this is directly from an
         asana API query).
     """
-    if key_by_index:
-        filt_data = {}
+    get_key = operator.itemgetter(match_key)
+    # Index allowed data by key so found_data (likely a single-iter gen) only
+    #  needs a single pass with a lookup per item
+    if isinstance(allowed_data, dict):
+        allowed_idx_by_key = allowed_data
     else:
-        filt_data = []
-    # Nested fors must be in this order - expect found_data is a single-iter gen
-    for found_item in found_data:
-        for i_allowed_item, allowed_item in enumerate(allowed_data):
-            if found_item[match_key] == allowed_item[match_key]:
-                if key_by_index:
-                    filt_data[i_allowed_item] = found_item
-                else:
-                    filt_data.append(found_item)
-                break
-    return filt_data
+        allowed_idx_by_key = index_by_key(allowed_data, match_key)
+
+    if key_by_index:
+        get_allowed_idx = allowed_idx_by_key.get
+        return {i_allowed_item: found_item for found_item in found_data
+                for i_allowed_item in (get_allowed_idx(get_key(found_item)),)
+                if i_allowed_item is not None}
+    return [f for f in found_data if get_key(f) in allowed_idx_by_key]
 
 
 
@@ -323,21 +486,28 @@ def subtest_asana_error_handler_func(caplog, exception_type, log_index, func,
 
 
 
-@pytest.mark.no_warnings_only
-def test_logging_capture_warnings(caplog):
+def test_logging_capture_warnings():
     """
     This tests that the `logging.captureWarnings(True)` line has been executed
     in the `aclient` module.
 
-    This must be run with the `-p no:warnings` option provided to `pytest`.  As
-    a result, it is skipped by default.  See `/conftest.py` for options.
+    The `pytest` warnings plugin records warnings during each test, which
+    overrides the `warnings.showwarning()` that `logging.captureWarnings()`
+    installs.  Rather than requiring the plugin be disabled (and so a separate
+    `pytest` run), this imports `aclient` and warns in a separate python
+    process, checking the warning was logged to the `py.warnings` logger.
     """
-    caplog.set_level(logging.WARNING)
-    caplog.clear()
-    warnings.warn('Test warning')
-    assert caplog.record_tuples[0][0] == 'py.warnings'
-    assert caplog.record_tuples[0][1] == logging.WARNING
-    assert 'Test warning' in caplog.record_tuples[0][2]
+    code = '\n'.join([
+        'import logging',
+        'import warnings',
+        'from asana_extensions.asana import client',
+        "logging.basicConfig(format='%(name)s|%(levelname)s|%(message)s')",
+        "warnings.warn('Test warning')",
+    ])
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True,
+            check=True, cwd=dirs.get_root_path(), text=True)
+    assert result.stderr.startswith('py.warnings|WARNING|')
+    assert 'Test warning' in result.stderr
 
 
 
@@ -371,27 +541,31 @@ def test_asana_error_handler(caplog):
 
 
 
-@pytest.mark.parametrize('func_name', [
-    '_get_me',
-    'get_workspace_gid_from_name',
-    'get_project_gid_from_name',
-    'get_section_gid_from_name',
-    'get_user_task_list_gid',
-    'get_section_gids_in_project_or_utl',
-    'get_tasks',
-    'move_task_to_section',
-])
-def test_dec_usage_asana_error_handler(func_name):
+def test_dec_usage_asana_error_handler():
     """
     Tests that functions that are expected to use the `@asana_error_handler`
     decorator do in fact have it.
+
+    Each check is a simple attribute read, so these are all done in this single
+    test rather than parametrized to avoid the per-test overhead.
     """
-    func = getattr(aclient, func_name)
-    assert func._is_wrapped_by_asana_error_handler is True
+    func_names = [
+        '_get_me',
+        'get_workspace_gid_from_name',
+        'get_project_gid_from_name',
+        'get_section_gid_from_name',
+        'get_user_task_list_gid',
+        'get_section_gids_in_project_or_utl',
+        'get_tasks',
+        'move_task_to_section',
+    ]
+    for func_name in func_names:
+        func = getattr(aclient, func_name)
+        assert func._is_wrapped_by_asana_error_handler is True, func_name
 
 
 
-def test__get_client(monkeypatch):
+def test__get_client(monkeypatch, secrets_conf):
     """
     Tests the `_get_client()` method.
 
@@ -408,8 +582,15 @@ def test__get_client(monkeypatch):
         """
         return {}
 
+    def mock_read_conf_file__secrets(           # pylint: disable=invalid-name
+            conf_rel_file,                     # pylint: disable=unused-argument
+            conf_base_dir=None):               # pylint: disable=unused-argument
+        """
+        Return the real secrets config already read for the session.
+        """
+        return secrets_conf
+
     # read_conf_file() returning bad config allows to confirm client cache works
-    orig_read_conf_file = config.read_conf_file
     monkeypatch.setattr(config, 'read_conf_file', mock_read_conf_file)
     client = aclient._get_client()
     assert client is not None
@@ -420,7 +601,7 @@ def test__get_client(monkeypatch):
     assert "Could not create client - Could not find necessary section/key in" \
             + " .secrets.conf: 'asana'" in str(ex.value)
 
-    monkeypatch.setattr(config, 'read_conf_file', orig_read_conf_file)
+    monkeypatch.setattr(config, 'read_conf_file', mock_read_conf_file__secrets)
 
     def mock_client_access_token__missing(          # pylint: disable=invalid-name
             accessToken):                      # pylint: disable=unused-argument
@@ -561,180 +742,102 @@ def test__find_gid_from_name(caplog):
 
 
 
-@pytest.mark.asana_error_data.with_args(asana.error.ForbiddenError)
-def test_get_workspace_gid_from_name(monkeypatch, caplog, raise_asana_error):
+@pytest.mark.parametrize('attr_path, exception_type, func_name, args', [
+    ('workspaces.get_workspaces', asana.error.ForbiddenError,
+        'get_workspace_gid_from_name', ('one and only',)),
+    ('projects.get_projects', asana.error.NotFoundError,
+        'get_project_gid_from_name', (0, 'one and only')),
+    ('sections.get_sections_for_project', asana.error.InvalidTokenError,
+        'get_section_gid_from_name', (0, 'one and only')),
+    ('user_task_lists.get_user_task_list_for_user', asana.error.ServerError,
+        'get_user_task_list_gid', (0, True)),
+])
+def test_error_handler_wraps_api_calls(caplog, inject_asana_error,
+        attr_path, exception_type, func_name, args):
     """
-    Tests the `get_workspace_gid_from_name()` method.
+    Tests the function-specific practical use of `@asana_error_handler` for
+    the methods that look up gids, confirming the errors raised by the API are
+    handled.
 
-    This does require the asana account be configured to support unit testing.
-    See CONTRIBUTING.md.
-
-    ** Consumes at least 2 API calls. **
-    (varies depending on data size, but only 2 calls intended)
+    Since the API calls are all monkeypatched to raise errors, the args provided
+    to the methods do not need to be real data.
 
-    Raises:
-      (TesterNotInitializedError): If test workspace does not exist on asana
-        account tied to access token, will stop test.  User must create
-        manually per docs.
+    No API calls.
     """
-    # pylint: disable=no-member     # asana.Client dynamically adds attrs
     caplog.set_level(logging.ERROR)
-
-    try:
-        aclient.get_workspace_gid_from_name(tester_data._WORKSPACE)
-    except aclient.DataNotFoundError as ex:
-        # This is an error with the tester, not the module under test
-        raise TesterNotInitializedError('Cannot run unit tests: Must create a'
-                + f' workspace named "{tester_data._WORKSPACE}" in the asana'
-                + ' account tied to access token in .secrets.conf') from ex
-
-    # To ensure compatible with _extract_gid_from_name(), validate data format
-    client = aclient._get_client()
-    workspaces = client.workspaces.get_workspaces()
-    workspace = next(workspaces)
-    assert 'gid' in workspace
-    assert 'name' in workspace
-    assert 'resource_type' in workspace
-
-    # Function-specific practical test of @asana_error_handler
-    # Need to monkeypatch cached client since class dynamically creates attrs
-    monkeypatch.setattr(client.workspaces, 'get_workspaces', raise_asana_error)
-    subtest_asana_error_handler_func(caplog, asana.error.ForbiddenError, 0,
-            aclient.get_workspace_gid_from_name, 'one and only')
+    inject_asana_error(attr_path, exception_type)
+    subtest_asana_error_handler_func(caplog, exception_type, 0,
+            getattr(aclient, func_name), *args)
 
 
 
-@pytest.mark.asana_error_data.with_args(asana.error.NotFoundError)
-def test_get_project_gid_from_name(monkeypatch, caplog, project_test,
-        raise_asana_error):
+@pytest.mark.usefixtures('api_data_shapes_validated')
+def test_get_workspace_gid_from_name(ws_gid):
     """
-    Tests the `get_project_gid_from_name()` method.
+    Tests the `get_workspace_gid_from_name()` method.
 
     This does require the asana account be configured to support unit testing.
     See CONTRIBUTING.md.
 
-    ** Consumes at least 3 API calls. **
-    (varies depending on data size, but only 3 calls intended)
+    ** Consumes at least 1 API call. **
+    (varies depending on data size, but only 1 call intended)
+    """
+    assert aclient.get_workspace_gid_from_name(tester_data._WORKSPACE,
+            ws_gid) == ws_gid
+
 
-    Raises:
-      (TesterNotInitializedError): If test workspace does not exist on asana
-        account tied to access token, will stop test.  User must create
-        manually per docs.
+
+@pytest.mark.usefixtures('api_data_shapes_validated')
+def test_get_project_gid_from_name(ws_gid, project_test):
     """
-    # pylint: disable=no-member     # asana.Client dynamically adds attrs
-    caplog.set_level(logging.ERROR)
+    Tests the `get_project_gid_from_name()` method.
 
-    try:
-        ws_gid = aclient.get_workspace_gid_from_name(tester_data._WORKSPACE)
-    except aclient.DataNotFoundError as ex:
-        # This is an error with the tester, not the module under test
-        raise TesterNotInitializedError('Cannot run unit tests: Must create a'
-                + f' workspace named "{tester_data._WORKSPACE}" in the asana'
-                + ' account tied to access token in .secrets.conf') from ex
+    This does require the asana account be configured to support unit testing.
+    See CONTRIBUTING.md.
 
+    ** Consumes at least 1 API call. **
+    (varies depending on data size, but only 1 call intended)
+    """
     # Sanity check that this works with an actual project
     proj_gid = aclient.get_project_gid_from_name(ws_gid, project_test['name'],
             int(project_test['gid']))
     assert proj_gid == int(project_test['gid'])
 
-    # To ensure compatible with _extract_gid_from_name(), validate data format
-    client = aclient._get_client()
-    projects = client.projects.get_projects({'workspace': str(ws_gid)})
-    project = next(projects)
-    assert 'gid' in project
-    assert 'name' in project
-    assert 'resource_type' in project
-
-    # Function-specific practical test of @asana_error_handler
-    # Need to monkeypatch cached client since class dynamically creates attrs
-    monkeypatch.setattr(client.projects, 'get_projects', raise_asana_error)
-    subtest_asana_error_handler_func(caplog, asana.error.NotFoundError, 0,
-            aclient.get_project_gid_from_name, ws_gid, project_test['name'])
-
 
 
-@pytest.mark.asana_error_data.with_args(asana.error.InvalidTokenError)
-def test_get_section_gid_from_name(monkeypatch, caplog, project_test,
-        sections_in_project_test, raise_asana_error):
+@pytest.mark.usefixtures('api_data_shapes_validated')
+def test_get_section_gid_from_name(project_test, sections_in_project_test):
     """
     Tests the `get_section_gid_from_name()` method.
 
     This does require the asana account be configured to support unit testing.
     See CONTRIBUTING.md.
 
-    ** Consumes at least 2 API calls. **
-    (varies depending on data size, but only 2 calls intended)
-
-    Raises:
-      (TesterNotInitializedError): If test workspace does not exist on asana
-        account tied to access token, will stop test.  User must create
-        manually per docs.
+    ** Consumes at least 1 API call. **
+    (varies depending on data size, but only 1 call intended)
     """
-    # pylint: disable=no-member     # asana.Client dynamically adds attrs
-    caplog.set_level(logging.ERROR)
-
     # Only need 1 section
     section_in_project_test = sections_in_project_test[0]
 
     # Sanity check that this works with an actual section
-    try:
-        sect_gid = aclient.get_section_gid_from_name(project_test['gid'],
-                section_in_project_test['name'],
-                int(section_in_project_test['gid']))
-    except aclient.DataNotFoundError as ex:
-        # This is an error with the tester, not the module under test
-        raise TesterNotInitializedError('Cannot run unit tests: Must create a'
-                + f' workspace named "{tester_data._WORKSPACE}" in the asana'
-                + ' account tied to access token in .secrets.conf') from ex
-
+    sect_gid = aclient.get_section_gid_from_name(project_test['gid'],
+            section_in_project_test['name'],
+            int(section_in_project_test['gid']))
     assert sect_gid == int(section_in_project_test['gid'])
 
-    # To ensure compatible with _extract_gid_from_name(), validate data format
-    client = aclient._get_client()
-    sections = client.sections.get_sections_for_project(project_test['gid'])
-    section = next(sections)
-    assert 'gid' in section
-    assert 'name' in section
-    assert 'resource_type' in section
-
-    # Function-specific practical test of @asana_error_handler
-    # Need to monkeypatch cached client since class dynamically creates attrs
-    monkeypatch.setattr(client.sections, 'get_sections_for_project',
-            raise_asana_error)
-    subtest_asana_error_handler_func(caplog, asana.error.InvalidTokenError, 0,
-            aclient.get_section_gid_from_name, project_test['gid'],
-            section_in_project_test['name'])
-
 
 
-@pytest.mark.asana_error_data.with_args(asana.error.ServerError)
-def test_get_user_task_list_gid(monkeypatch, caplog, raise_asana_error):
+def test_get_user_task_list_gid(me_data, ws_gid):
     """
     Tests the `get_user_task_list_gid()` method.
 
     This does require the asana account be configured to support unit testing.
     See CONTRIBUTING.md.
 
-    ** Consumes at least 4 API calls. **
-    (varies depending on data size, but only 4 calls intended)
-
-    Raises:
-      (TesterNotInitializedError): If test workspace does not exist on asana
-        account tied to access token, will stop test.  User must create
-        manually per docs.
+    ** Consumes at least 2 API calls. **
+    (varies depending on data size, but only 2 calls intended)
     """
-    # pylint: disable=no-member     # asana.Client dynamically adds attrs
-    caplog.set_level(logging.ERROR)
-
-    try:
-        ws_gid = aclient.get_workspace_gid_from_name(tester_data._WORKSPACE)
-    except aclient.DataNotFoundError as ex:
-        # This is an error with the tester, not the module under test
-        raise TesterNotInitializedError('Cannot run unit tests: Must create a'
-                + f' workspace named "{tester_data._WORKSPACE}" in the asana'
-                + ' account tied to access token in .secrets.conf') from ex
-
-    me_gid = aclient._get_me()['gid']
+    me_gid = me_data['gid']
     me_utl_gid = aclient.get_user_task_list_gid(ws_gid, True)
     uid_utl_gid = aclient.get_user_task_list_gid(ws_gid, user_gid=me_gid)
     assert me_utl_gid == uid_utl_gid
@@ -748,19 +851,11 @@ def test_get_user_task_list_gid(monkeypatch, caplog, raise_asana_error):
         aclient.get_user_task_list_gid(0, True, 0)
     assert 'Must provide `is_me` or `user_gid`, but not both.' in str(ex.value)
 
-    # Function-specific practical test of @asana_error_handler
-    client = aclient._get_client()
-    # Need to monkeypatch cached client since class dynamically creates attrs
-    monkeypatch.setattr(client.user_task_lists, 'get_user_task_list_for_user',
-            raise_asana_error)
-    subtest_asana_error_handler_func(caplog, asana.error.ServerError, 0,
-            aclient.get_user_task_list_gid, 0, True)
-
 
 
 @pytest.mark.asana_error_data.with_args(asana.error.InvalidRequestError)
-def test_get_section_gids_in_project_or_utl(monkeypatch, caplog, project_test,
-        sections_in_project_test, raise_asana_error):
+def test_get_section_gids_in_project_or_utl(caplog, project_test,
+        sections_in_project_test, inject_asana_error):
     """
     Tests the `get_section_gids_in_project_or_utl()` method.
 
@@ -769,11 +864,6 @@ def test_get_section_gids_in_project_or_utl(monkeypatch, caplog, project_test,
 
     ** Consumes at least 1 API call. **
     (varies depending on data size, but only 1 call intended)
-
-    Raises:
-      (TesterNotInitializedError): If test workspace does not exist on asana
-        account tied to access token, will stop test.  User must create
-        manually per docs.
     """
     # pylint: disable=no-member     # asana.Client dynamically adds attrs
     caplog.set_level(logging.ERROR)
@@ -781,58 +871,33 @@ def test_get_section_gids_in_project_or_utl(monkeypatch, caplog, project_test,
     # Only need 1 section
     section_in_project_test = sections_in_project_test[0]
 
-    try:
-        sect_gids = aclient.get_section_gids_in_project_or_utl(
-                project_test['gid'])
-    except aclient.DataNotFoundError as ex:
-        # This is an error with the tester, not the module under test
-        raise TesterNotInitializedError('Cannot run unit tests: Must create a'
-                + f' workspace named "{tester_data._WORKSPACE}" in the asana'
-                + ' account tied to access token in .secrets.conf') from ex
-
+    sect_gids = aclient.get_section_gids_in_project_or_utl(project_test['gid'])
     assert int(section_in_project_test['gid']) in sect_gids
 
     # Function-specific practical test of @asana_error_handler
-    client = aclient._get_client()
-    # Need to monkeypatch cached client since class dynamically creates attrs
-    monkeypatch.setattr(client.sections, 'get_sections_for_project',
-            raise_asana_error)
+    inject_asana_error('sections.get_sections_for_project')
     subtest_asana_error_handler_func(caplog, asana.error.InvalidRequestError, 0,
             aclient.get_section_gids_in_project_or_utl, project_test['gid'])
 
 
 
 @pytest.mark.asana_error_data.with_args(asana.error.NoAuthorizationError)
-def test_get_tasks(monkeypatch, caplog,        # pylint: disable=too-many-locals
-        project_test, sections_in_project_test, sections_in_utl_test,
-        tasks_in_project_and_utl_test, raise_asana_error):
+def test_get_tasks(caplog,                     # pylint: disable=too-many-locals
+        me_data, ws_gid, project_test, sections_in_project_test,
+        sections_in_utl_test, tasks_in_project_and_utl_test,
+        tasks_in_project_and_utl_test_idx_by_gid, inject_asana_error):
     """
     Tests the `get_tasks()` method.
 
     This does require the asana account be configured to support unit testing.
     See CONTRIBUTING.md.
 
-    ** Consumes at least 4 API calls. **
-    (varies depending on data size, but only 4 calls intended)
-
-    Raises:
-      (TesterNotInitializedError): If test workspace does not exist on asana
-        account tied to access token, will stop test.  User must create
-        manually per docs.
+    ** Consumes at least 2 API calls. **
+    (varies depending on data size, but only 2 calls intended)
     """
     # pylint: disable=no-member     # asana.Client dynamically adds attrs
     caplog.set_level(logging.ERROR)
 
-    try:
-        me_data = aclient._get_me()
-    except aclient.DataNotFoundError as ex:
-        # This is an error with the tester, not the module under test
-        raise TesterNotInitializedError('Cannot run unit tests: Must create a'
-                + f' workspace named "{tester_data._WORKSPACE}" in the asana'
-                + ' account tied to access token in .secrets.conf') from ex
-
-    ws_gid = aclient.get_workspace_gid_from_name(tester_data._WORKSPACE)
-
     params = {
         'assignee': me_data['gid'],
         'workspace': ws_gid,
@@ -845,7 +910,7 @@ def test_get_tasks(monkeypatch, caplog,        # pylint: disable=too-many-locals
     ]
     tasks_found = aclient.get_tasks(params, fields)
     tasks_to_check = filter_result_for_test(tasks_found,
-            tasks_in_project_and_utl_test, 'gid', True)
+            tasks_in_project_and_utl_test_idx_by_gid, 'gid', True)
     assert len(tasks_to_check) == len(tasks_in_project_and_utl_test)
     for i_task_expected, task_found in tasks_to_check.items():
         task_expected = tasks_in_project_and_utl_test[i_task_expected]
@@ -866,7 +931,7 @@ def test_get_tasks(monkeypatch, caplog,        # pylint: disable=too-many-locals
     ]
     tasks_found = aclient.get_tasks(params, fields)
     tasks_to_check = filter_result_for_test(tasks_found,
-            tasks_in_project_and_utl_test, 'gid', True)
+            tasks_in_project_and_utl_test_idx_by_gid, 'gid', True)
     assert len(tasks_to_check) == len(tasks_in_project_and_utl_test)
     for i_task_expected, task_found in tasks_to_check.items():
         task_expected = tasks_in_project_and_utl_test[i_task_expected]
@@ -878,47 +943,29 @@ def test_get_tasks(monkeypatch, caplog,        # pylint: disable=too-many-locals
                     if 'section' in m]
 
     # Function-specific practical test of @asana_error_handler
-    client = aclient._get_client()
-    # Need to monkeypatch cached client since class dynamically creates attrs
-    monkeypatch.setattr(client.tasks, 'get_tasks', raise_asana_error)
+    inject_asana_error('tasks.get_tasks')
     subtest_asana_error_handler_func(caplog, asana.error.NoAuthorizationError,
             0, aclient.get_tasks, {})
 
 
 
+@pytest.mark.usefixtures('ws_gid')
 @pytest.mark.asana_error_data.with_args(asana.error.PremiumOnlyError)
-def test_move_task_to_section__common(monkeypatch, caplog, raise_asana_error):
+def test_move_task_to_section__common(caplog, inject_asana_error):
     """
     Tests common elements for the `move_task_to_section()` method.
 
     This does require the asana account be configured to support unit testing.
-    See CONTRIBUTING.md.
-
-    ** Consumes at least 1 API call. **
-    (varies depending on data size, but only 1 call intended)
+    See CONTRIBUTING.md.  This is confirmed once for the session by the `ws_gid`
+    fixture, which will stop the test if not configured.
 
-    Raises:
-      (TesterNotInitializedError): If test workspace does not exist on asana
-        account tied to access token, will stop test.  User must create
-        manually per docs.
+    ** Consumes no API calls beyond the session fixtures. **
     """
     # pylint: disable=no-member     # asana.Client dynamically adds attrs
     caplog.set_level(logging.ERROR)
 
-    try:
-        # Simple test that project is configured, but non-error result not used
-        aclient._get_me()
-    except aclient.DataNotFoundError as ex:
-        # This is an error with the tester, not the module under test
-        raise TesterNotInitializedError('Cannot run unit tests: Must create a'
-                + f' workspace named "{tester_data._WORKSPACE}" in the asana'
-                + ' account tied to access token in .secrets.conf') from ex
-
     # Function-specific practical test of @asana_error_handler
-    client = aclient._get_client()
-    # Need to monkeypatch cached client since class dynamically creates attrs
-    monkeypatch.setattr(client.sections, 'add_task_for_section',
-            raise_asana_error)
+    inject_asana_error('sections.add_task_for_section')
     subtest_asana_error_handler_func(caplog, asana.error.PremiumOnlyError,
             0, aclient.move_task_to_section, -1, -2)
 
@@ -933,33 +980,20 @@ def test_move_task_to_section__common(monkeypatch, caplog, raise_asana_error):
 ])
 def test_move_task_to_section__parametrized(is_utl_test, i_sect, move_to_bottom,
         sections_in_project_test, sections_in_utl_test,
-        tasks_movable_in_project_and_utl_test):
+        tasks_movable_in_project_and_utl_test,
+        tasks_movable_in_project_and_utl_test_idx_by_gid):
     """
     Tests parametrized paths for the `move_task_to_section()` method.
 
     This does require the asana account be configured to support unit testing.
     See CONTRIBUTING.md.
 
-    ** Consumes at least 14 API calls total. **
-    (varies depending on data size, but only 4 calls intended)
-    (API call count is 3 [+1 if not is_utl_test] for each parameter)
-    (  with equal num with and without is_utl_test: 3.5*num_parameters)
-
-    Raises:
-      (TesterNotInitializedError): If test workspace does not exist on asana
-        account tied to access token, will stop test.  User must create
-        manually per docs.
+    ** Consumes at least 10 API calls total. **
+    (varies depending on data size, but only 10 calls intended)
+    (API call count is 2 [+1 if not is_utl_test] for each parameter)
+    (  with equal num with and without is_utl_test: 2.5*num_parameters)
     """
     # pylint: disable=no-member     # asana.Client dynamically adds attrs
-    try:
-        # Simple test that project is configured, but non-error result not used
-        aclient._get_me()
-    except aclient.DataNotFoundError as ex:
-        # This is an error with the tester, not the module under test
-        raise TesterNotInitializedError('Cannot run unit tests: Must create a'
-                + f' workspace named "{tester_data._WORKSPACE}" in the asana'
-                + ' account tied to access token in .secrets.conf') from ex
-
     if is_utl_test:
         sects = sections_in_utl_test
     else:
@@ -973,7 +1007,7 @@ def test_move_task_to_section__parametrized(is_utl_test, i_sect, move_to_bottom,
     }
     tasks_found = aclient.get_tasks(params)
     tasks_to_check = filter_result_for_test(tasks_found,
-            tasks_movable_in_project_and_utl_test, 'gid')
+            tasks_movable_in_project_and_utl_test_idx_by_gid, 'gid')
     assert len(tasks_to_check) == 2
     if move_to_bottom:
         assert tasks_to_check[-1]['gid'] \
@@ -984,7 +1018,8 @@ def test_move_task_to_section__parametrized(is_utl_test, i_sect, move_to_bottom,
 
 
 
-def test_pagination(project_test, sections_in_project_test):
+def test_pagination(monkeypatch, asana_client, project_test,
+        sections_in_project_test):
     """
     Tests compatibility with `asana` package to ensure that any pagination is
     handled in a way that is compatible with how this project expects it.
@@ -992,12 +1027,10 @@ def test_pagination(project_test, sections_in_project_test):
     ** Consumes at least 2 API calls. **
     (varies depending on data size, but only 2 calls intended)
     """
-    client = aclient._get_client()
-    client.options['page_size'] = 1
+    monkeypatch.setitem(asana_client.options, 'page_size', 1)
 
     sect_gids = aclient.get_section_gids_in_project_or_utl(project_test['gid'])
 
     # Should match exactly, but other tests may have added more sects to server
     assert len(sect_gids) >= len(sections_in_project_test)
-    for sect in sections_in_project_test:
-        assert int(sect['gid']) in sect_gids
+    assert {int(s['gid']) for s in sections_in_project_test} <= set(sect_gids)
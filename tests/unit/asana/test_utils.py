@@ -8,7 +8,20 @@ with auto-discovery (others may exist, but will not be part of test suite
 directly).
 
 Module Attributes:
-  N/A
+  _DT_FILTER_TASKS ([{str:any}]): Tasks with due dates/times to filter in tests,
+    including some with bad data.
+  _DT_FILTER_GOOD_TASKS ([{str:any}]): The subset of `_DT_FILTER_TASKS` that has
+    good data.
+  _TZINFO_* (timezone): Timezones to use as the target timezone in tests.
+  _DT_BASE_* (datetime): Base datetimes from which to filter in tests.
+  _RD_* (relativedelta): Relative times until due from which to filter in
+    tests.
+  _ASSUMED_TIME_* (time): Times due to assume for tasks with only due dates in
+    tests.
+  _SECT_GIDS ([int]): Fake section gids in a project/user task list used to
+    mock getting all section gids in tests.
+  _NAMES_TO_GIDS ({str:int}): Fake map of section names to gids used to mock
+    section gid lookups by name in tests.
 
 (C) Copyright 2021 Jonathan Casey.  All Rights Reserved Worldwide.
 """
@@ -17,7 +30,7 @@ Module Attributes:
 import datetime as dt
 import logging
 import operator
-import uuid
+import secrets
 
 from dateutil.relativedelta import relativedelta
 import pytest
@@ -28,24 +41,78 @@ from tests.unit.asana import tester_data
 
 
 
+# 'due_on' corresponds to 'due_at' as though set in UTC-0500 timezone
+_DT_FILTER_TASKS = [
+    {'t': 0, 'due_on': '2021-01-01'},
+    {'t': 1, 'due_on': '2020-12-31'},
+    {'t': 2, 'due_on': '2021-01-02', 'due_at': None},
+    {'t': 3, 'due_at': '2021-01-01T21:00-0500', 'due_on': '2021-01-01'},
+    {'t': 4, 'due_at': '2021-01-02T21:00-0500', 'due_on': '2021-01-02'},
+    {'t': 5, 'due_at': '2021-01-02T02:00Z', 'due_on': '2021-01-01'},
+    {'t': 6, 'due_at': '2021-01-01T21:00Z', 'due_on': '2021-01-01'},
+    {'t': 7, 'due_on': None, 'due_at': None},
+    {'t': 8, 'due_at': '2021-01-02 21:00', 'due_on': 'bad timezone'},
+    {'t': 9, 'no_due_key': 'this is bad'},
+]
+_DT_FILTER_GOOD_TASKS = _DT_FILTER_TASKS[:8]
+
+_TZINFO_1 = dt.timezone(dt.timedelta(hours=-5))
+_TZINFO_2 = dt.timezone(dt.timedelta(hours=0))
+
+_DT_BASE_1 = dt.datetime(2021, 1, 1, 21, 0, tzinfo=_TZINFO_1)
+_DT_BASE_2 = dt.datetime(2021, 1, 1, 19, 0, tzinfo=_TZINFO_1)
+_DT_BASE_3 = dt.datetime(2021, 1, 2, 0, 0,
+        tzinfo=_TZINFO_2) # Same as _DT_BASE_2, but different timezone
+_DT_BASE_4 = dt.datetime(2021, 1, 2, 2, 0,
+        tzinfo=_TZINFO_2) # Same as _DT_BASE_1, but different timezone
+
+_RD_DATE_TODAY = relativedelta(days=0)
+_RD_DATE_TOMORROW = relativedelta(days=1)
+_RD_DATE_YESTERDAY = relativedelta(days=-1)
+_RD_DATETIME_2H_LATER = relativedelta(hours=2)
+_RD_DATETIME_1M_AGO = relativedelta(minutes=-1)
+_RD_DATETIME_YESTERDAY_AND_1M_AGO = relativedelta(days=-1, minutes=-1)
+
+_ASSUMED_TIME_1 = dt.time(21, 0)
+_ASSUMED_TIME_2 = dt.time(23, 0)
+_ASSUMED_TIME_3 = dt.time(1, 0)
+_ASSUMED_TIME_4 = dt.time(23, 30)
+
+_SECT_GIDS = [1, 2, 3, 4, 5, 6]
+
+_NAMES_TO_GIDS = {
+    'one': 1,
+    'two': 2,
+    'three': 3,
+    'four': 4,
+    # Intentionally skipping 5, 6
+    'seven': 7,
+    'eight': 8,
+    'nine': 9,
+}
+
+
+
 @pytest.fixture(name='tasks_with_due_in_utl_test', scope='session')
-def fixture_tasks_with_due_in_utl_test(sections_in_utl_test):
+def fixture_tasks_with_due_in_utl_test(me_data, ws_gid, sections_in_utl_test,
+        send_batch_actions):
     """
     Creates tasks with and without due dates/times in the user task list (in the
     test workspace), and returns a list of them, each of which is the dict of
     data that should match the `data` element returned by the API.
 
-    Will delete the tasks once done with all tests.
+    Will delete the tasks once done with all tests.  If any fail to be created,
+    the ones that were created are deleted before failing.
 
     This is not being used with the autouse keyword so that, if running tests
     that do not require this section fixture, they can run more optimally
     without the need to needlessly create and delete this section.  (Also,
     could not figure out how to get rid of all syntax and pylint errors).
 
-    ** Consumes 20 API calls. **
-    (API call count is 2*num_tasks + 2)
+    ** Consumes 2 API calls. **
+    (API call count is 2*ceil(num_tasks/10) as batches, but each task still
+    counts twice against rate limits)
     """
-    # pylint: disable=no-member     # asana.Client dynamically adds attrs
     task_due_params = [
         {'due_on': '2021-01-01'},   # 0
         {'due_on': '2020-12-31'},   # 1
@@ -57,27 +124,39 @@ def fixture_tasks_with_due_in_utl_test(sections_in_utl_test):
         {},     # 7
         {'due_on': '2021-01-01', 'completed': True},    # 8
     ]
-    client = aclient._get_client()
-    me_data = aclient._get_me()
-    ws_gid = aclient.get_workspace_gid_from_name(tester_data._WORKSPACE)
-
-    task_data_list = []
-    for task_due_param in task_due_params:
-        task_name = tester_data._TASK_TEMPLATE.substitute({'tid': uuid.uuid4()})
-        params = {
-            'assignee': me_data['gid'],
-            'assignee_section': sections_in_utl_test[1]['gid'],
-            'name': task_name,
-            'workspace': str(ws_gid),
+
+    base_params = {
+        'assignee': me_data['gid'],
+        'assignee_section': sections_in_utl_test[1]['gid'],
+        'workspace': str(ws_gid),
+    }
+    create_actions = [{
+        'method': 'post',
+        'relative_path': '/tasks',
+        'data': {
+            **base_params,
+            'name': tester_data._task_name(secrets.token_hex(8)),
+            **task_due_param,
+        },
+    } for task_due_param in task_due_params]
+
+    def delete_action(task_data):
+        """
+        Gets the batch action to delete the task.
+        """
+        return {
+            'method': 'delete',
+            'relative_path': f'/tasks/{task_data["gid"]}',
         }
-        params = {**params, **task_due_param}
-        task_data = client.tasks.create_task(params)
-        task_data_list.append(task_data)
+
+    # Tests only compare sets of tasks, so creation order in section is moot
+    task_data_list = send_batch_actions(create_actions,
+            undo_action=delete_action)
 
     yield task_data_list
 
-    for task_data in task_data_list:
-        client.tasks.delete_task(task_data['gid'])
+    send_batch_actions([delete_action(t) for t in task_data_list],
+            ignore_not_found=True)
 
 
 
@@ -90,30 +169,16 @@ def test_get_net_include_section_gids(monkeypatch, caplog):
     def mock_get_section_gids_in_project_or_utl(
             proj_or_utl_gid):                  # pylint: disable=unused-argument
         """
-        Returns a list of fake gids that can be used for testing.
+        Returns a copy of the list of fake gids that can be used for testing.
         """
-        return [1, 2, 3, 4, 5, 6]
-
+        return list(_SECT_GIDS)
 
-    def mock_get_section_gid_from_name(
-            proj_or_utl_gid, sect_name,        # pylint: disable=unused-argument
+    def mock_get_section_gid_from_name(proj_or_utl_gid, sect_name,
             sect_gid=None):                    # pylint: disable=unused-argument
         """
-        Makes a fake map of names to gids, then returns the gid for a given
-        name.
+        Returns the fake gid for the section name.
         """
-        names_to_gids = {
-            'one': 1,
-            'two': 2,
-            'three': 3,
-            'four': 4,
-            # Intentionally skipping 5, 6
-            'seven': 7,
-            'eight': 8,
-            'nine': 9,
-        }
-        return names_to_gids[sect_name]
-
+        return _NAMES_TO_GIDS[sect_name]
 
     monkeypatch.setattr(aclient, 'get_section_gids_in_project_or_utl',
             mock_get_section_gids_in_project_or_utl)
@@ -135,16 +200,18 @@ def test_get_net_include_section_gids(monkeypatch, caplog):
 
     with pytest.raises(autils.DataMissingError) as ex:
         autils.get_net_include_section_gids(0, [], [7])
-    assert 'Section names/gids explicitly included are missing' in str(ex.value)
-    assert 'provided by name): 7.' in str(ex.value)
-    assert 'Also check names:' not in str(ex.value)
+    ex_msg = str(ex.value)
+    assert 'Section names/gids explicitly included are missing' in ex_msg
+    assert 'provided by name): 7.' in ex_msg
+    assert 'Also check names:' not in ex_msg
 
     with pytest.raises(autils.DataMissingError) as ex:
         autils.get_net_include_section_gids(0, ['seven', 'nine'], [7, 8, 10],
                 ['eight'])
-    assert 'Section names/gids explicitly included are missing' in str(ex.value)
-    assert 'provided by name): 8, 9, 10, 7.' in str(ex.value)
-    assert 'Also check names: `eight`, `nine`, `seven`.' in str(ex.value)
+    ex_msg = str(ex.value)
+    assert 'Section names/gids explicitly included are missing' in ex_msg
+    assert 'provided by name): 8, 9, 10, 7.' in ex_msg
+    assert 'Also check names: `eight`, `nine`, `seven`.' in ex_msg
 
     caplog.clear()
     assert autils.get_net_include_section_gids(0, ['one'], [2, 3],
@@ -162,6 +229,7 @@ def test_get_net_include_section_gids(monkeypatch, caplog):
     with pytest.raises(autils.DataConflictError) as ex:
         autils.get_net_include_section_gids(0, ['one', 'two', 'three'],
                 [4, 5, 6], ['one', 'four'], [2, 5, 7])
+    ex_msg = str(ex.value)
     assert caplog.record_tuples == [
             ('asana_extensions.asana.utils', logging.WARNING,
                 'Section names/gids explicitly excluded are missing from'
@@ -169,34 +237,45 @@ def test_get_net_include_section_gids(monkeypatch, caplog):
                 + ' Check gids (some may not be explicitly in list if'
                 + ' provided by name): 7.'),
     ]
-    assert 'Explicit section names/gids cannot be simultaneously' \
-            in str(ex.value)
-    assert 'provided by name): 1, 2, 4, 5' in str(ex.value)
-    assert 'Also check names: `one`, `two`, `four`.' in str(ex.value)
+    assert 'Explicit section names/gids cannot be simultaneously' in ex_msg
+    assert 'provided by name): 1, 2, 4, 5' in ex_msg
+    assert 'Also check names: `one`, `two`, `four`.' in ex_msg
 
     with pytest.raises(autils.DataConflictError) as ex:
         autils.get_net_include_section_gids(0, ['one', 'two', 'three'],
                 [4, 5, 6], ['seven', 'eight'], [4, 5])
-    assert 'Explicit section names/gids cannot be simultaneously' \
-            in str(ex.value)
-    assert 'provided by name): 4, 5' in str(ex.value)
-    assert 'Also check names:' not in str(ex.value)
+    ex_msg = str(ex.value)
+    assert 'Explicit section names/gids cannot be simultaneously' in ex_msg
+    assert 'provided by name): 4, 5' in ex_msg
+    assert 'Also check names:' not in ex_msg
 
 
 
-def test_get_filtered_tasks( # pylint: disable=too-many-locals, too-many-statements
-        sections_in_utl_test, tasks_with_due_in_utl_test):
+def get_idxs_of_created_tasks(filt_tasks, created_tasks):
     """
-    Tests the `get_filtered_tasks()` method.
+    Gets the indices of the created tasks that are in the filtered tasks,
+    ignoring any other tasks in the filtered tasks (e.g. created by other
+    tests in the same section).
+
+    Args:
+      filt_tasks ([{str:any}]): The tasks returned by a filter.  Must have the
+        'gid' key.
+      created_tasks ([{str:any}]): The tasks created for the test, in the order
+        they are indexed.  Must have the 'gid' key.
+
+    Returns:
+      ({int}): The indices in `created_tasks` of the tasks that are in
+        `filt_tasks`.
+    """
+    filt_gids = set(map(operator.itemgetter('gid'), filt_tasks))
+    return {i for i, t in enumerate(created_tasks) if t['gid'] in filt_gids}
 
-    This intentionally falls thru to test `_filter_tasks_by_datetime()` and the
-    asana API, as it is critical to detect any functional breakages here.
 
-    These test cases (or at least the data) are largely aligned with
-    `test__filter_tasks_by_datetime()`.
 
-    ** Consumes at least 13 API calls. **
-    (varies depending on data size, but only 10 calls intended)
+def test_get_filtered_tasks__arg_conflicts():
+    """
+    Tests the `get_filtered_tasks()` method fails on conflicting args before
+    making any API calls.
     """
     with pytest.raises(AssertionError) as ex:
         autils.get_filtered_tasks(0)
@@ -208,259 +287,236 @@ def test_get_filtered_tasks( # pylint: disable=too-many-locals, too-many-stateme
     assert 'Must provide min/max until due or specify no due date but not' \
             + ' both' in str(ex.value)
 
+
+
+def test_get_filtered_tasks__no_due_date(sections_in_utl_test,
+        tasks_with_due_in_utl_test):
+    """
+    Tests the `get_filtered_tasks()` method when matching tasks with no due
+    date, including the fields returned for the tasks.
+
+    ** Consumes at least 1 API call. **
+    (varies depending on data size, but only 1 call intended)
+    """
     # Use same section gid as used in `tasks_with_due_in_utl_test`
-    sect_gid = sections_in_utl_test[1]['gid']
-    # Will be comparing task names only
-    created_task_gids = [t['gid'] for t in tasks_with_due_in_utl_test]
-
-    filt_tasks = autils.get_filtered_tasks(sect_gid, True)
-    tasks_to_check = [t for t in filt_tasks if t['gid'] in created_task_gids]
-    assert {created_task_gids[i] for i in [7]} \
-            == {t['gid'] for t in tasks_to_check}
-    assert tasks_to_check[0]['completed'] is False
-    assert 'due_at' in tasks_to_check[0]
-    assert 'due_on' in tasks_to_check[0]
-    assert tasks_to_check[0]['name'] == tasks_with_due_in_utl_test[7]['name']
-    assert tasks_to_check[0]['resource_type'] == 'task'
-
-    tzinfo_1 = dt.timezone(dt.timedelta(hours=-5))
-    tzinfo_2 = dt.timezone(dt.timedelta(hours=0))
-
-    dt_base_1 = dt.datetime(2021, 1, 1, 21, 0, tzinfo=tzinfo_1)
-
-    rd_date_today = relativedelta(days=0)
-    rd_date_tomorrow = relativedelta(days=1)
-    rd_date_yesterday = relativedelta(days=-1)
-    rd_datetime_2h_later = relativedelta(hours=2)
-    rd_datetime_1m_ago = relativedelta(minutes=-1)
-    rd_datetime_yesterday_and_1m_ago = relativedelta(days=-1, minutes=-1)
-
-    assumed_time_1 = dt.time(21, 0)
-    assumed_time_2 = dt.time(23, 30)
-
-    filt_tasks = autils.get_filtered_tasks(sect_gid, False, rd_date_today,
-            rd_date_today, assumed_time_1, use_tzinfo=tzinfo_1,
-            dt_base=dt_base_1)
-    tasks_to_check = [t for t in filt_tasks if t['gid'] in created_task_gids]
-    assert {created_task_gids[i] for i in [0, 3, 5, 6]} \
-            == {t['gid'] for t in tasks_to_check}
-
-    # To test if the use_tzinfo default arg is work, need to compensate based
-    #  on system timezone and re-call previous test.
-    tz_diff = dt_base_1.utcoffset() - dt_base_1.astimezone(None).utcoffset()
-    dt_base_1_tz_diffed = dt_base_1 + tz_diff
-    filt_tasks = autils.get_filtered_tasks(sect_gid, False, rd_date_today,
-            rd_date_today, dt_base=dt_base_1_tz_diffed)
-    tasks_to_check = [t for t in filt_tasks if t['gid'] in created_task_gids]
-    assert {created_task_gids[i] for i in [0, 3, 5, 6]} \
-            == {t['gid'] for t in tasks_to_check}
-
-    filt_tasks = autils.get_filtered_tasks(sect_gid, False, rd_date_today,
-            rd_date_today, use_tzinfo=tzinfo_2, dt_base=dt_base_1)
-    tasks_to_check = [t for t in filt_tasks if t['gid'] in created_task_gids]
-    assert {created_task_gids[i] for i in [2, 4]} \
-            == {t['gid'] for t in tasks_to_check}
-
-    filt_tasks = autils.get_filtered_tasks(sect_gid, False, rd_date_today,
-            rd_date_today, is_completed=True, use_tzinfo=tzinfo_1,
-            dt_base=dt_base_1)
-    tasks_to_check = [t for t in filt_tasks if t['gid'] in created_task_gids]
-    assert {created_task_gids[i] for i in [8]} \
-            == {t['gid'] for t in tasks_to_check}
-
-    filt_tasks = autils.get_filtered_tasks(sect_gid, False, rd_date_today,
-            rd_date_today, is_completed=None, use_tzinfo=tzinfo_1,
-            dt_base=dt_base_1)
-    tasks_to_check = [t for t in filt_tasks if t['gid'] in created_task_gids]
-    assert {created_task_gids[i] for i in [0, 3, 5, 6, 8]} \
-            == {t['gid'] for t in tasks_to_check}
-
-    filt_tasks = autils.get_filtered_tasks(sect_gid, False, rd_date_today,
-            rd_date_tomorrow, None, assumed_time_1, use_tzinfo=tzinfo_1,
-            dt_base=dt_base_1)
-    tasks_to_check = [t for t in filt_tasks if t['gid'] in created_task_gids]
-    assert {created_task_gids[i] for i in [0, 2, 3, 4, 5, 6]} \
-            == {t['gid'] for t in tasks_to_check}
-
-    filt_tasks = autils.get_filtered_tasks(sect_gid, False, None,
-            rd_date_yesterday, use_tzinfo=tzinfo_1, dt_base=dt_base_1)
-    tasks_to_check = [t for t in filt_tasks if t['gid'] in created_task_gids]
-    assert {created_task_gids[i] for i in [1]} \
-            == {t['gid'] for t in tasks_to_check}
-
-    filt_tasks = autils.get_filtered_tasks(sect_gid, False, rd_date_tomorrow,
-            None, use_tzinfo=tzinfo_1, dt_base=dt_base_1)
-    tasks_to_check = [t for t in filt_tasks if t['gid'] in created_task_gids]
-    assert {created_task_gids[i] for i in [2, 4]} \
-            == {t['gid'] for t in tasks_to_check}
-
-    filt_tasks = autils.get_filtered_tasks(sect_gid, False, rd_datetime_1m_ago,
-            rd_datetime_2h_later, assumed_time_1, use_tzinfo=tzinfo_1,
-            dt_base=dt_base_1)
-    tasks_to_check = [t for t in filt_tasks if t['gid'] in created_task_gids]
-    assert {created_task_gids[i] for i in [3, 5]} \
-            == {t['gid'] for t in tasks_to_check}
-
-    filt_tasks = autils.get_filtered_tasks(sect_gid, False, rd_datetime_1m_ago,
-            rd_datetime_2h_later, assumed_time_1, assumed_time_1,
-            use_tzinfo=tzinfo_1, dt_base=dt_base_1)
-    tasks_to_check = [t for t in filt_tasks if t['gid'] in created_task_gids]
-    assert {created_task_gids[i] for i in [0, 3, 5]} \
-            == {t['gid'] for t in tasks_to_check}
-
-    filt_tasks = autils.get_filtered_tasks(sect_gid, False,
-            rd_datetime_yesterday_and_1m_ago, rd_datetime_2h_later,
-            assumed_time_1, assumed_time_2, use_tzinfo=tzinfo_1,
-            dt_base=dt_base_1)
-    tasks_to_check = [t for t in filt_tasks if t['gid'] in created_task_gids]
-    assert {created_task_gids[i] for i in [1, 3, 5, 6]} \
-            == {t['gid'] for t in tasks_to_check}
-
-    # Assumes all tasks in the past by more than a few days!
-    filt_tasks = autils.get_filtered_tasks(sect_gid, False, None,
-            rd_datetime_1m_ago)
-    tasks_to_check = [t for t in filt_tasks if t['gid'] in created_task_gids]
-    assert {created_task_gids[i] for i in [3, 4, 5, 6]} \
-            == {t['gid'] for t in tasks_to_check}
-
-
-
-def test__filter_tasks_by_datetime():      # pylint: disable=too-many-statements
+    filt_tasks = autils.get_filtered_tasks(sections_in_utl_test[1]['gid'],
+            True)
+    assert get_idxs_of_created_tasks(filt_tasks, tasks_with_due_in_utl_test) \
+            == {7}
+
+    task_to_check = next(t for t in filt_tasks
+            if t['gid'] == tasks_with_due_in_utl_test[7]['gid'])
+    assert task_to_check['completed'] is False
+    assert 'due_at' in task_to_check
+    assert 'due_on' in task_to_check
+    assert task_to_check['name'] == tasks_with_due_in_utl_test[7]['name']
+    assert task_to_check['resource_type'] == 'task'
+
+
+
+@pytest.mark.parametrize(
+        'min_until_due, max_until_due, min_assumed, max_assumed, kwargs,'
+        + ' i_tasks_expected', [
+    pytest.param(_RD_DATE_TODAY, _RD_DATE_TODAY, _ASSUMED_TIME_1, None, {},
+            {0, 3, 5, 6}, id='today'),
+    pytest.param(_RD_DATE_TODAY, _RD_DATE_TODAY, None, None,
+            {'use_tzinfo': _TZINFO_2}, {2, 4}, id='today-other-tz'),
+    pytest.param(_RD_DATE_TODAY, _RD_DATE_TODAY, None, None,
+            {'is_completed': True}, {8}, id='today-completed'),
+    pytest.param(_RD_DATE_TODAY, _RD_DATE_TODAY, None, None,
+            {'is_completed': None}, {0, 3, 5, 6, 8}, id='today-any-completed'),
+    pytest.param(_RD_DATE_TODAY, _RD_DATE_TOMORROW, None, _ASSUMED_TIME_1, {},
+            {0, 2, 3, 4, 5, 6}, id='today-to-tomorrow'),
+    pytest.param(None, _RD_DATE_YESTERDAY, None, None, {},
+            {1}, id='until-yesterday'),
+    pytest.param(_RD_DATE_TOMORROW, None, None, None, {},
+            {2, 4}, id='from-tomorrow'),
+    pytest.param(_RD_DATETIME_1M_AGO, _RD_DATETIME_2H_LATER, _ASSUMED_TIME_1,
+            None, {}, {3, 5}, id='datetime-min-assumed'),
+    pytest.param(_RD_DATETIME_1M_AGO, _RD_DATETIME_2H_LATER, _ASSUMED_TIME_1,
+            _ASSUMED_TIME_1, {}, {0, 3, 5}, id='datetime-both-assumed'),
+    pytest.param(_RD_DATETIME_YESTERDAY_AND_1M_AGO, _RD_DATETIME_2H_LATER,
+            _ASSUMED_TIME_1, _ASSUMED_TIME_4, {}, {1, 3, 5, 6},
+            id='datetime-from-yesterday'),
+])
+def test_get_filtered_tasks(sections_in_utl_test, tasks_with_due_in_utl_test,
+        min_until_due, max_until_due, min_assumed, max_assumed, kwargs,
+        i_tasks_expected):
     """
-    Tests the `_filter_tasks_by_datetime()` method.
+    Tests the `get_filtered_tasks()` method.
+
+    This intentionally falls thru to test `_filter_tasks_by_datetime()` and the
+    asana API, as it is critical to detect any functional breakages here.
 
     These test cases (or at least the data) are largely aligned with
-    `test_get_filtered_tasks()`.
+    `test__filter_tasks_by_datetime()`.  Unless overridden by `kwargs`, these
+    all evaluate from `_DT_BASE_1` in `_TZINFO_1`.
+
+    ** Consumes at least 1 API call. **
+    (varies depending on data size, but only 1 call intended)
     """
-    # 'due_on' corresponds to 'due_at' as though set in UTC-0500 timezone
-    all_tasks = [
-        {'t': 0, 'due_on': '2021-01-01'},
-        {'t': 1, 'due_on': '2020-12-31'},
-        {'t': 2, 'due_on': '2021-01-02', 'due_at': None},
-        {'t': 3, 'due_at': '2021-01-01T21:00-0500', 'due_on': '2021-01-01'},
-        {'t': 4, 'due_at': '2021-01-02T21:00-0500', 'due_on': '2021-01-02'},
-        {'t': 5, 'due_at': '2021-01-02T02:00Z', 'due_on': '2021-01-01'},
-        {'t': 6, 'due_at': '2021-01-01T21:00Z', 'due_on': '2021-01-01'},
-        {'t': 7, 'due_on': None, 'due_at': None},
-        {'t': 8, 'due_at': '2021-01-02 21:00', 'due_on': 'bad timezone'},
-        {'t': 9, 'no_due_key': 'this is bad'},
-    ]
-    good_tasks = all_tasks[:8]
+    # Use same section gid as used in `tasks_with_due_in_utl_test`
+    filt_tasks = autils.get_filtered_tasks(sections_in_utl_test[1]['gid'],
+            False, min_until_due, max_until_due, min_assumed, max_assumed,
+            **{'use_tzinfo': _TZINFO_1, 'dt_base': _DT_BASE_1, **kwargs})
+    assert get_idxs_of_created_tasks(filt_tasks, tasks_with_due_in_utl_test) \
+            == i_tasks_expected
 
-    dt_base_1 = dt.datetime(2021, 1, 1, 21, 0, tzinfo=dt.timezone(
-            dt.timedelta(hours=-5)))
-    dt_base_2 = dt.datetime(2021, 1, 1, 19, 0, tzinfo=dt.timezone(
-            dt.timedelta(hours=-5)))
-    dt_base_3 = dt.datetime(2021, 1, 2, 0, 0, tzinfo=dt.timezone(
-            dt.timedelta(hours=0))) # Same as dt_base_2, but different timezone
-    dt_base_4 = dt.datetime(2021, 1, 2, 2, 0, tzinfo=dt.timezone(
-            dt.timedelta(hours=0))) # Same as dt_base_1, but different timezone
 
-    rd_date_today = relativedelta(days=0)
-    rd_datetime_2h_later = relativedelta(hours=2)
 
-    assumed_time_1 = dt.time(21, 0)
-    assumed_time_2 = dt.time(23, 0)
-    assumed_time_3 = dt.time(1, 0)
+def test_get_filtered_tasks__default_tzinfo(sections_in_utl_test,
+        tasks_with_due_in_utl_test):
+    """
+    Tests the `get_filtered_tasks()` method uses the system timezone when no
+    `use_tzinfo` is provided.  This needs to compensate based on the system
+    timezone to re-check the 'today' case of `test_get_filtered_tasks()`.
 
-    # Set 1: No filter
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_1, None,
-            operator.lt)
-    assert filt_tasks == good_tasks
+    ** Consumes at least 1 API call. **
+    (varies depending on data size, but only 1 call intended)
+    """
+    tz_diff = _DT_BASE_1.utcoffset() - _DT_BASE_1.astimezone(None).utcoffset()
+    filt_tasks = autils.get_filtered_tasks(sections_in_utl_test[1]['gid'],
+            False, _RD_DATE_TODAY, _RD_DATE_TODAY,
+            dt_base=_DT_BASE_1 + tz_diff)
+    assert get_idxs_of_created_tasks(filt_tasks, tasks_with_due_in_utl_test) \
+            == {0, 3, 5, 6}
 
-    # Set 2: Date filter
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_1,
-            rd_date_today, operator.ge)
-    assert filt_tasks == [all_tasks[i] for i in [0, 2, 3, 4, 5, 6]]
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_1,
-            rd_date_today, operator.le)
-    assert filt_tasks == [all_tasks[i] for i in [0, 1, 3, 5, 6]]
 
-    # Set 3: Datetime filter
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_1,
-            rd_datetime_2h_later, operator.ge)
-    assert filt_tasks == [all_tasks[i] for i in [4]]
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_1,
-            rd_datetime_2h_later, operator.lt)
-    assert filt_tasks == [all_tasks[i] for i in [3, 5, 6]]
 
-    # Set 4: Datetime filter, different time but same tz as Set 3
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_2,
-            rd_datetime_2h_later, operator.ge)
-    assert filt_tasks == [all_tasks[i] for i in [3, 4, 5]]
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_2,
-            rd_datetime_2h_later, operator.lt)
-    assert filt_tasks == [all_tasks[i] for i in [6]]
+def test_get_filtered_tasks__default_dt_base(sections_in_utl_test,
+        tasks_with_due_in_utl_test):
+    """
+    Tests the `get_filtered_tasks()` method uses now as the base when no
+    `dt_base` is provided.
 
-    # Set 5: Date filter, different tz than Set 2
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_3,
-            rd_date_today, operator.ge)
-    assert filt_tasks == [all_tasks[i] for i in [2, 4]]
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_3,
-            rd_date_today, operator.le)
-    assert filt_tasks == good_tasks[:7]
+    Assumes all tasks are in the past by more than a few days!
 
-    # Set 6: Datetime filter, different tz than Set 4 (no effect)
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_3,
-            rd_datetime_2h_later, operator.ge)
-    assert filt_tasks == [all_tasks[i] for i in [3, 4, 5]]
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_3,
-            rd_datetime_2h_later, operator.lt)
-    assert filt_tasks == [all_tasks[i] for i in [6]]
+    ** Consumes at least 1 API call. **
+    (varies depending on data size, but only 1 call intended)
+    """
+    filt_tasks = autils.get_filtered_tasks(sections_in_utl_test[1]['gid'],
+            False, None, _RD_DATETIME_1M_AGO)
+    assert get_idxs_of_created_tasks(filt_tasks, tasks_with_due_in_utl_test) \
+            == {3, 4, 5, 6}
 
-    # Set 7: Date filter, assumed time added to Set 5 (no effect)
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_3,
-            rd_date_today, operator.ge, assumed_time_1)
-    assert filt_tasks == [all_tasks[i] for i in [2, 4]]
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_3,
-            rd_date_today, operator.le, assumed_time_1)
-    assert filt_tasks == good_tasks[:7]
 
-    # Set 8: Datetime filter, assumed time added to Set 3
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_1,
-            rd_datetime_2h_later, operator.ge, assumed_time_1)
-    assert filt_tasks == [all_tasks[i] for i in [2, 4]]
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_1,
-            rd_datetime_2h_later, operator.lt, assumed_time_1)
-    assert filt_tasks == [all_tasks[i] for i in [0, 1, 3, 5, 6]]
 
+@pytest.mark.parametrize(
+        'dt_base, rel_dt_until_due, op, time_due_assumed, i_tasks_expected', [
+    # Set 1: No filter
+    pytest.param(_DT_BASE_1, None, operator.lt, None, list(range(8)),
+            id='set1-lt'),
+    # Set 2: Date filter
+    pytest.param(_DT_BASE_1, _RD_DATE_TODAY, operator.ge, None,
+            [0, 2, 3, 4, 5, 6], id='set2-ge'),
+    pytest.param(_DT_BASE_1, _RD_DATE_TODAY, operator.le, None,
+            [0, 1, 3, 5, 6], id='set2-le'),
+    # Set 3: Datetime filter
+    pytest.param(_DT_BASE_1, _RD_DATETIME_2H_LATER, operator.ge, None,
+            [4], id='set3-ge'),
+    pytest.param(_DT_BASE_1, _RD_DATETIME_2H_LATER, operator.lt, None,
+            [3, 5, 6], id='set3-lt'),
+    # Set 4: Datetime filter, different time but same tz as Set 3
+    pytest.param(_DT_BASE_2, _RD_DATETIME_2H_LATER, operator.ge, None,
+            [3, 4, 5], id='set4-ge'),
+    pytest.param(_DT_BASE_2, _RD_DATETIME_2H_LATER, operator.lt, None,
+            [6], id='set4-lt'),
+    # Set 5: Date filter, different tz than Set 2
+    pytest.param(_DT_BASE_3, _RD_DATE_TODAY, operator.ge, None,
+            [2, 4], id='set5-ge'),
+    pytest.param(_DT_BASE_3, _RD_DATE_TODAY, operator.le, None,
+            list(range(7)), id='set5-le'),
+    # Set 6: Datetime filter, different tz than Set 4 (no effect)
+    pytest.param(_DT_BASE_3, _RD_DATETIME_2H_LATER, operator.ge, None,
+            [3, 4, 5], id='set6-ge'),
+    pytest.param(_DT_BASE_3, _RD_DATETIME_2H_LATER, operator.lt, None,
+            [6], id='set6-lt'),
+    # Set 7: Date filter, assumed time added to Set 5 (no effect)
+    pytest.param(_DT_BASE_3, _RD_DATE_TODAY, operator.ge, _ASSUMED_TIME_1,
+            [2, 4], id='set7-ge'),
+    pytest.param(_DT_BASE_3, _RD_DATE_TODAY, operator.le, _ASSUMED_TIME_1,
+            list(range(7)), id='set7-le'),
+    # Set 8: Datetime filter, assumed time added to Set 3
+    pytest.param(_DT_BASE_1, _RD_DATETIME_2H_LATER, operator.ge,
+            _ASSUMED_TIME_1, [2, 4], id='set8-ge'),
+    pytest.param(_DT_BASE_1, _RD_DATETIME_2H_LATER, operator.lt,
+            _ASSUMED_TIME_1, [0, 1, 3, 5, 6], id='set8-lt'),
     # Set 9: Datetime filter, different assumed time than Set 8
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_1,
-            rd_datetime_2h_later, operator.ge, assumed_time_2)
-    assert filt_tasks == [all_tasks[i] for i in [0, 2, 4]]
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_1,
-            rd_datetime_2h_later, operator.lt, assumed_time_2)
-    assert filt_tasks == [all_tasks[i] for i in [1, 3, 5, 6]]
-
+    pytest.param(_DT_BASE_1, _RD_DATETIME_2H_LATER, operator.ge,
+            _ASSUMED_TIME_2, [0, 2, 4], id='set9-ge'),
+    pytest.param(_DT_BASE_1, _RD_DATETIME_2H_LATER, operator.lt,
+            _ASSUMED_TIME_2, [1, 3, 5, 6], id='set9-lt'),
     # Set 10: Datetime filter, different assumed time than Set 8
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_1,
-            rd_datetime_2h_later, operator.ge, assumed_time_3)
-    assert filt_tasks == [all_tasks[i] for i in [2, 4]]
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_1,
-            rd_datetime_2h_later, operator.lt, assumed_time_3)
-    assert filt_tasks == [all_tasks[i] for i in [0, 1, 3, 5, 6]]
-
+    pytest.param(_DT_BASE_1, _RD_DATETIME_2H_LATER, operator.ge,
+            _ASSUMED_TIME_3, [2, 4], id='set10-ge'),
+    pytest.param(_DT_BASE_1, _RD_DATETIME_2H_LATER, operator.lt,
+            _ASSUMED_TIME_3, [0, 1, 3, 5, 6], id='set10-lt'),
     # Set 11: Datetime filter, different timezone than Set 10
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_4,
-            rd_datetime_2h_later, operator.ge, assumed_time_3)
-    assert filt_tasks == [all_tasks[i] for i in [4]]
-    filt_tasks = autils._filter_tasks_by_datetime(good_tasks, dt_base_4,
-            rd_datetime_2h_later, operator.lt, assumed_time_3)
-    assert filt_tasks == [all_tasks[i] for i in [0, 1, 2, 3, 5, 6]]
-
-    # Set 12: Failure modes
+    pytest.param(_DT_BASE_4, _RD_DATETIME_2H_LATER, operator.ge,
+            _ASSUMED_TIME_3, [4], id='set11-ge'),
+    pytest.param(_DT_BASE_4, _RD_DATETIME_2H_LATER, operator.lt,
+            _ASSUMED_TIME_3, [0, 1, 2, 3, 5, 6], id='set11-lt'),
+])
+def test__filter_tasks_by_datetime(dt_base, rel_dt_until_due, op,
+        time_due_assumed, i_tasks_expected):
+    """
+    Tests the `_filter_tasks_by_datetime()` method.
+
+    These test cases (or at least the data) are largely aligned with
+    `test_get_filtered_tasks()`.
+    """
+    filt_tasks = autils._filter_tasks_by_datetime(_DT_FILTER_GOOD_TASKS,
+            dt_base, rel_dt_until_due, op, time_due_assumed)
+    assert filt_tasks == [_DT_FILTER_TASKS[i] for i in i_tasks_expected]
+
+
+
+def test__filter_tasks_by_datetime__failure_modes():
+    """
+    Tests the failure modes of the `_filter_tasks_by_datetime()` method.
+    """
     with pytest.raises(TypeError) as ex:
-        autils._filter_tasks_by_datetime(all_tasks[8:], dt_base_1,
-                rd_datetime_2h_later, operator.ge)
+        autils._filter_tasks_by_datetime(_DT_FILTER_TASKS[8:], _DT_BASE_1,
+                _RD_DATETIME_2H_LATER, operator.ge)
     assert "can't compare offset-naive and offset-aware datetimes" \
             in str(ex.value)
     with pytest.raises(KeyError) as ex:
-        autils._filter_tasks_by_datetime(all_tasks[9:], dt_base_1,
-                rd_date_today, operator.ge)
+        autils._filter_tasks_by_datetime(_DT_FILTER_TASKS[9:], _DT_BASE_1,
+                _RD_DATE_TODAY, operator.ge)
     assert 'due_on' in str(ex.value)
 
 
 
+def test__parse_due_on():
+    """
+    Tests the `_parse_due_on()` method.
+    """
+    assert autils._parse_due_on('2021-01-02') == dt.date(2021, 1, 2)
+
+    with pytest.raises(ValueError):
+        autils._parse_due_on('bad date')
+
+
+
+def test__parse_due_at():
+    """
+    Tests the `_parse_due_at()` method.
+    """
+    assert autils._parse_due_at('2021-01-02T02:00Z') \
+            == dt.datetime(2021, 1, 2, 2, 0, tzinfo=dt.timezone.utc)
+    assert autils._parse_due_at('2021-01-01T21:00-0500') \
+            == dt.datetime(2021, 1, 2, 2, 0, tzinfo=dt.timezone.utc)
+    assert autils._parse_due_at('2021-01-02T02:00:00.000Z') \
+            == dt.datetime(2021, 1, 2, 2, 0, tzinfo=dt.timezone.utc)
+    assert autils._parse_due_at('2021-01-01T21:00:00-05:00') \
+            == dt.datetime(2021, 1, 2, 2, 0, tzinfo=dt.timezone.utc)
+    assert autils._parse_due_at('2021-01-02 21:00').tzinfo is None
+
+    with pytest.raises(ValueError):
+        autils._parse_due_at('bad datetime')
+
+
+
 def test__filter_tasks_by_completed():
     """
     Tests the `_filter_tasks_by_completed()` method.
@@ -10,31 +10,57 @@ Module Attributes:
     personal access token being used for testing (in `.secrets.conf`) prior to
     running tests.
 
-  _PROJECT_TEMPLATE (Template): The name format to be used for test projects
-    created in the test workspace for unit testing.  IDs will be substituted as
-    needed for testing.  This will be created and deleted as needed during unit
-    testing.
+(C) Copyright 2021 Jonathan Casey.  All Rights Reserved Worldwide.
+"""
+
+
+
+_WORKSPACE = 'TEST Asana Extensions'
+
+
 
-  _SECTION_TEMPLATE (Template): The name format to be used for test sections
-    created in the test workspace for unit testing.  IDs will be substituted as
-    needed for testing.  This will be created and deleted as needed during unit
+def _project_name(pid):
+    """
+    Gets the name to be used for a test project created in the test workspace
+    for unit testing.  This will be created and deleted as needed during unit
     testing.
 
-  _TASK_TEMPLATE (Template): The name format to be used for test tasks created
-    in the test workspace for unit testing.  IDs will be substituted as needed
-    for testing.  This will be created and deleted as needed during unit
+    Args:
+      pid (any): The ID to make the project name unique.
+
+    Returns:
+      (str): The name of the test project.
+    """
+    return f'TEST Project {pid}'
+
+
+
+def _section_name(sid):
+    """
+    Gets the name to be used for a test section created in the test workspace
+    for unit testing.  This will be created and deleted as needed during unit
     testing.
 
-(C) Copyright 2021 Jonathan Casey.  All Rights Reserved Worldwide.
-"""
-from string import Template
+    Args:
+      sid (any): The ID to make the section name unique.
 
+    Returns:
+      (str): The name of the test section.
+    """
+    return f'TEST Section {sid}'
 
 
-_WORKSPACE = 'TEST Asana Extensions'
 
-_PROJECT_TEMPLATE = Template('TEST Project $pid')
+def _task_name(tid):
+    """
+    Gets the name to be used for a test task created in the test workspace for
+    unit testing.  This will be created and deleted as needed during unit
+    testing.
 
-_SECTION_TEMPLATE = Template('TEST Section $sid')
+    Args:
+      tid (any): The ID to make the task name unique.
 
-_TASK_TEMPLATE = Template('TEST Task $tid')
+    Returns:
+      (str): The name of the test task.
+    """
+    return f'TEST Task {tid}'
@@ -7,15 +7,17 @@ with auto-discovery (others may exist, but will not be part of test suite
 directly).
 
 Module Attributes:
-  N/A
+  _TEST_CONF_DIR (str): The path to the dir of the test config files.
 
 (C) Copyright 2021 Jonathan Casey.  All Rights Reserved Worldwide.
 """
 #pylint: disable=use-implicit-booleaness-not-comparison
 #   +-> want to specifically check type in most tests -- `None` is a fail
 
+import collections
 import logging
 import os.path
+import re
 
 import pytest
 
@@ -24,6 +26,11 @@ from asana_extensions.general import dirs
 
 
 
+_TEST_CONF_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+        'test_config')
+
+
+
 @pytest.fixture(name='mock_get_conf_path')
 def fixture_mock_get_conf_path():
     """
@@ -33,15 +40,7 @@ def fixture_mock_get_conf_path():
       (method): Returns a method that will mock getting the conf path.  Intended
         to be monkeypatched in for the equivalent method in dirs.
     """
-    def mock_dirs_get_conf_path():
-        """
-        Get the test dir's conf path.
-        """
-        this_dir = os.path.dirname(os.path.realpath(__file__))
-        conf_dir = os.path.join(this_dir, 'test_config')
-        return conf_dir
-
-    return mock_dirs_get_conf_path
+    return lambda: _TEST_CONF_DIR
 
 
 
@@ -51,16 +50,14 @@ def test_read_conf_file_fake_header(mock_get_conf_path, monkeypatch):
     with no header, regardless of whether a fake header name was provided or the
     default was used.
     """
-    this_dir = os.path.dirname(os.path.realpath(__file__))
-    conf_dir = os.path.join(this_dir, 'test_config')
     parser = config.read_conf_file_fake_header('mock_config_no_header.conf',
-            conf_dir)
+            _TEST_CONF_DIR)
     assert parser['fake']['test key no header'] == 'test-val-no-header'
     assert parser['test-section']['test key str'] \
             == 'test-val-str'
 
     parser = config.read_conf_file_fake_header('mock_config_no_header.conf',
-            conf_dir, 'new fake')
+            _TEST_CONF_DIR, 'new fake')
     assert parser['new fake']['test key no header'] == 'test-val-no-header'
     assert parser['test-section']['test key str'] \
             == 'test-val-str'
@@ -78,9 +75,7 @@ def test_read_conf_file(mock_get_conf_path, monkeypatch):
     Tests that the `read_conf_file()` will correctly read a file, checking a
     couple values.
     """
-    this_dir = os.path.dirname(os.path.realpath(__file__))
-    conf_dir = os.path.join(this_dir, 'test_config')
-    parser = config.read_conf_file('mock_config.conf', conf_dir)
+    parser = config.read_conf_file('mock_config.conf', _TEST_CONF_DIR)
     assert parser['test-section']['test key str'] == 'test-val-str'
     assert parser.getint('test-section', 'test key int') == 123
 
@@ -91,142 +86,212 @@ def test_read_conf_file(mock_get_conf_path, monkeypatch):
 
 
 
-def test_cast_var():
+@pytest.mark.parametrize('var, cast_type, kwargs, expected', [
+    ('5', config.CastType.INT, {}, 5),
+    ('3.14', config.CastType.FLOAT, {}, 3.14),
+    ('test str', config.CastType.STRING, {}, 'test str'),
+    ('five', config.CastType.INT, {'fallback_to_original': True}, 'five'),
+    # Skipping failed string cast due to expected rarity
+])
+def test_cast_var(var, cast_type, kwargs, expected):
     """
     Tests `cast_var()` for all `CastType`, so by extention tests that enum also.
     """
-    good_int_str = '5'
-    good_float_str = '3.14'
-    good_str = 'test str'
-    good_int = int(good_int_str)
-    good_float = float(good_float_str)
-    bad_int_str = 'five'
-    bad_float_str = 'pi'
-
-    assert good_int == config.cast_var(good_int_str, config.CastType.INT)
-    assert good_float == config.cast_var(good_float_str, config.CastType.FLOAT)
-    assert good_str == config.cast_var(good_str, config.CastType.STRING)
-
-    with pytest.raises(TypeError) as ex:
-        config.cast_var(good_int, 'invalid_cast_type')
-    assert 'Cast failed -- unsupported type.' in str(ex.value)
-
-    with pytest.raises(ValueError) as ex:
-        config.cast_var(bad_int_str, config.CastType.INT)
-    assert "invalid literal for int() with base 10: 'five'" in str(ex.value)
-
-    with pytest.raises(ValueError) as ex:
-        config.cast_var(bad_float_str, config.CastType.FLOAT)
-    assert "could not convert string to float: 'pi'" in str(ex.value)
+    assert expected == config.cast_var(var, cast_type, **kwargs)
 
-    # Skipping failed string cast due to expected rarity
 
-    assert bad_int_str == config.cast_var(bad_int_str, config.CastType.INT,
-            True)
 
+@pytest.mark.parametrize('var, cast_type, exp_exc_type, exp_msg', [
+    (5, 'invalid_cast_type', TypeError, 'Cast failed -- unsupported type.'),
+    ('five', config.CastType.INT, ValueError,
+            "invalid literal for int() with base 10: 'five'"),
+    ('pi', config.CastType.FLOAT, ValueError,
+            "could not convert string to float: 'pi'"),
+])
+def test_cast_var__failures(var, cast_type, exp_exc_type, exp_msg):
+    """
+    Tests `cast_var()` fails as expected for unsupported types and bad values.
+    """
+    with pytest.raises(exp_exc_type, match=re.escape(exp_msg)):
+        config.cast_var(var, cast_type)
+
+
+
+@pytest.mark.parametrize('conf_str, cast_type, kwargs, expected', [
+    ('', config.CastType.STRING, {}, []),
+    ('one, two, three', config.CastType.STRING, {}, ['one', 'two', 'three']),
+    ('one,\r\ntwo,  \r\n\r\n  three', config.CastType.STRING, {},
+            ['one', 'two', 'three']),
+    ('one,\r\ntwo,  \r\n\r\n  three', config.CastType.STRING,
+            {'delim_newlines': True}, ['one', 'two', 'three']),
+    ('one\ntwo  \r\n\r\n  three', config.CastType.STRING,
+            {'delim_newlines': True}, ['one', 'two', 'three']),
+    ('one\ntwo  \r\n\r\n  three', config.CastType.STRING,
+            {'delim': None, 'delim_newlines': True}, ['one', 'two', 'three']),
+    ('one, "two", \'three\'', config.CastType.STRING, {},
+            ['one', '"two"', "'three'"]),
+    ('one, "two", \'three\'', config.CastType.STRING, {'strip_quotes': True},
+            ['one', 'two', 'three']),
+    ('one | two | three', config.CastType.STRING, {'delim': '|'},
+            ['one', 'two', 'three']),
+    ('1, 2, 3', config.CastType.INT, {}, [1, 2, 3]),
+    ('1, 1.5, 2, two-and-a-third, 3', config.CastType.INT, {}, [1, 2, 3]),
+    ('1.0, 2.00, 3.000', config.CastType.FLOAT, {}, [1.0, 2.00, 3.000]),
+])
+def test_parse_list_from_conf_string(conf_str, cast_type, kwargs, expected):
+    """
+    Tests `parse_list_from_conf_string()`.
+    """
+    assert expected == config.parse_list_from_conf_string(conf_str, cast_type,
+            **kwargs)
 
 
-def test_parse_list_from_conf_string():
+
+class ListHandler(logging.Handler):
     """
-    Tests `parse_list_from_conf_string()`.
+    Simple handler that keeps the messages of the records it handles in a list
+    rather than writing them anywhere.
+
+    Instance Attributes:
+      messages ([str]): The messages of the records handled, in order.
     """
-    conf_list_strs = ['one', 'two', 'three']
-    conf_str_simple = 'one, two, three'
-    conf_str_newlines = 'one\ntwo  \r\n\r\n  three'
-    conf_str_newlines_and_commas = 'one,\r\ntwo,  \r\n\r\n  three'
-    conf_str_quotes = 'one, "two", \'three\''
-    conf_str_delim = 'one | two | three'
-    delim_char = '|'
-
-    conf_list_ints = [1, 2, 3]
-    conf_str_ints = '1, 2, 3'
-    conf_str_ints_mixed = '1, 1.5, 2, two-and-a-third, 3'
-    conf_list_floats = [1.0, 2.00, 3.000]
-    conf_str_floats = '1.0, 2.00, 3.000'
-
-    assert [] == config.parse_list_from_conf_string('', config.CastType.STRING)
-    assert conf_list_strs == config.parse_list_from_conf_string(
-            conf_str_simple, config.CastType.STRING)
-    assert conf_list_strs == config.parse_list_from_conf_string(
-            conf_str_newlines_and_commas, config.CastType.STRING)
-    assert conf_list_strs == config.parse_list_from_conf_string(
-            conf_str_newlines_and_commas, config.CastType.STRING,
-            delim_newlines=True)
-    assert conf_list_strs == config.parse_list_from_conf_string(
-            conf_str_newlines, config.CastType.STRING,
-            delim_newlines=True)
-    assert conf_list_strs == config.parse_list_from_conf_string(
-            conf_str_newlines, config.CastType.STRING, delim=None,
-            delim_newlines=True)
-    assert conf_list_strs != config.parse_list_from_conf_string(
-            conf_str_quotes, config.CastType.STRING)
-    assert conf_list_strs == config.parse_list_from_conf_string(
-            conf_str_quotes, config.CastType.STRING, strip_quotes=True)
-    assert conf_list_strs == config.parse_list_from_conf_string(
-            conf_str_delim, config.CastType.STRING, delim_char)
-
-    assert conf_list_ints == config.parse_list_from_conf_string(
-            conf_str_ints, config.CastType.INT)
-    assert conf_list_ints == config.parse_list_from_conf_string(
-            conf_str_ints_mixed, config.CastType.INT)
-    assert conf_list_floats == config.parse_list_from_conf_string(
-            conf_str_floats, config.CastType.FLOAT)
-
-
-
-def test_level_filter(caplog, capsys):
+    def __init__(self, level=logging.NOTSET):
+        """
+        Creates the handler with no messages yet.
+
+        Args:
+          level (int/str): The level of the handler.
+        """
+        super().__init__(level)
+        self.messages = []
+
+
+
+    def emit(self, record):
+        """
+        Keeps the message of the record.
+
+        Args:
+          record (LogRecord): The log record to handle.
+        """
+        self.messages.append(record.getMessage())
+
+
+
+@pytest.fixture(name='level_loggers')
+def fixture_level_loggers():
+    """
+    Sets up a logger with a list handler at each of the levels used to test
+    `LevelFilter`.  Once done, the handlers are removed from the loggers so they
+    do not remain attached to these (global) loggers for the rest of the
+    session.
+
+    Returns:
+      ({str:ListHandler}, {str:Logger}): The handlers and loggers, each keyed by
+        the level name.
+    """
+    handlers = {}
+    loggers = {}
+    for level in ['INFO', 'WARNING', 'ERROR']:
+        handlers[level] = ListHandler(level)
+
+        loggers[level] = logging.getLogger(f'test logger {level.lower()}')
+        loggers[level].addHandler(handlers[level])
+        loggers[level].setLevel(level)
+
+    yield handlers, loggers
+
+    for level, handler in handlers.items():
+        loggers[level].removeHandler(handler)
+        handler.close()
+
+
+
+def test_level_filter(caplog, level_loggers):
     """
     Tests `LevelFilter` entirely.
 
     Note that caplog does NOT respect filters added to handlers, so results in
-    records/record_tuples must then also be checked against capsys to confirm
-    logging actually went through or did not as expected (stderr used for all as
-    default).
+    records/record_tuples must then also be checked against the messages each
+    handler kept to confirm logging actually went through or did not as
+    expected.
     """
     filter_above_info = config.LevelFilter(min_exc_level=logging.INFO)
     filter_above_info_upto_warning = config.LevelFilter('info', 30)
     filter_upto_warning = config.LevelFilter(max_inc_level='WARNING')
 
-    handlers = {}
-    loggers = {}
-    test_levels = ['INFO', 'WARNING', 'ERROR']
-    for level in test_levels:
-        handlers[level] = logging.StreamHandler()
-        handlers[level].setLevel(level)
+    handlers, loggers = level_loggers
+    test_levels = list(loggers)
 
-        loggers[level] = logging.getLogger(f'test logger {level.lower()}')
-        loggers[level].addHandler(handlers[level])
-        loggers[level].setLevel(level)
+    def pop_handled_msgs():
+        """
+        Gets the messages kept by all handlers and clears them for next phase.
 
-    caplog.set_level(logging.DEBUG)
+        Returns:
+          ({str}): The messages kept by all handlers.
+        """
+        msgs = {m for h in handlers.values() for m in h.messages}
+        for handler in handlers.values():
+            handler.messages.clear()
+        return msgs
 
-    caplog.clear()
-    for level in test_levels:
-        loggers[level].info(f'1. test, msg info, log {level}')
-    assert caplog.record_tuples == [
+    def log_phase(phase, *msg_levels):
+        """
+        Logs a message at each of the message levels to each logger.
+
+        Args:
+          phase (int): The phase number to prefix each message with.
+          msg_levels (str): The level names at which to log the messages.
+        """
+        for level in test_levels:
+            log = loggers[level].log
+            for msg_level in msg_levels:
+                log(logging.getLevelName(msg_level),
+                        f'{phase}. test, msg {msg_level.lower()}, log {level}')
+
+    log_phase(1, 'INFO')
+    assert pop_handled_msgs() == {
+        '1. test, msg info, log INFO',
+    }
+
+    log_phase(2, 'WARNING')
+    assert pop_handled_msgs() == {
+        '2. test, msg warning, log INFO',
+        '2. test, msg warning, log WARNING',
+    }
+
+    handlers['INFO'].addFilter(filter_above_info)
+    log_phase(3, 'INFO', 'WARNING')
+    assert pop_handled_msgs() == {
+        '3. test, msg warning, log INFO',
+        '3. test, msg warning, log WARNING',
+    }
+
+    handlers['INFO'].removeFilter(filter_above_info)
+    handlers['INFO'].addFilter(filter_above_info_upto_warning)
+    handlers['WARNING'].addFilter(filter_upto_warning)
+    log_phase(4, 'INFO', 'WARNING', 'ERROR')
+    assert pop_handled_msgs() == {
+        '4. test, msg warning, log INFO',
+        '4. test, msg warning, log WARNING',
+        '4. test, msg error, log ERROR',
+    }
+
+    # caplog is checked once for all phases, grouping by the msg phase prefix
+    by_phase = collections.defaultdict(list)
+    for record_tuple in caplog.record_tuples:
+        by_phase[record_tuple[2][:2]].append(record_tuple)
+    assert list(by_phase) == ['1.', '2.', '3.', '4.']
+    assert by_phase['1.'] == [
         ('test logger info', logging.INFO, '1. test, msg info, log INFO'),
     ]
-    assert '1. test, msg info, log INFO' in capsys.readouterr().err
-
-    caplog.clear()
-    for level in test_levels:
-        loggers[level].warning(f'2. test, msg warning, log {level}')
-    assert caplog.record_tuples == [
+    assert by_phase['2.'] == [
         ('test logger info', logging.WARNING,
             '2. test, msg warning, log INFO'),
         ('test logger warning', logging.WARNING,
             '2. test, msg warning, log WARNING'),
     ]
-    stderr = capsys.readouterr().err
-    assert '2. test, msg warning, log INFO' in stderr
-    assert '2. test, msg warning, log WARNING' in stderr
-
-    caplog.clear()
-    handlers['INFO'].addFilter(filter_above_info)
-    for level in test_levels:
-        loggers[level].info(f'3. test, msg info, log {level}')
-        loggers[level].warning(f'3. test, msg warning, log {level}')
-    assert caplog.record_tuples == [
+    assert by_phase['3.'] == [
         ('test logger info', logging.INFO,
             '3. test, msg info, log INFO'),
         ('test logger info', logging.WARNING,
@@ -234,20 +299,7 @@ def test_level_filter(caplog, capsys):
         ('test logger warning', logging.WARNING,
             '3. test, msg warning, log WARNING'),
     ]
-    stderr = capsys.readouterr().err
-    assert '3. test, msg info, log INFO' not in stderr
-    assert '3. test, msg warning, log INFO' in stderr
-    assert '3. test, msg warning, log WARNING' in stderr
-
-    handlers['INFO'].removeFilter(filter_above_info)
-    caplog.clear()
-    handlers['INFO'].addFilter(filter_above_info_upto_warning)
-    handlers['WARNING'].addFilter(filter_upto_warning)
-    for level in test_levels:
-        loggers[level].info(f'4. test, msg info, log {level}')
-        loggers[level].warning(f'4. test, msg warning, log {level}')
-        loggers[level].error(f'4. test, msg error, log {level}')
-    assert caplog.record_tuples == [
+    assert by_phase['4.'] == [
         ('test logger info', logging.INFO,
             '4. test, msg info, log INFO'),
         ('test logger info', logging.WARNING,
@@ -261,10 +313,3 @@ def test_level_filter(caplog, capsys):
         ('test logger error', logging.ERROR,
             '4. test, msg error, log ERROR'),
     ]
-    stderr = capsys.readouterr().err
-    assert '4. test, msg info, log INFO' not in stderr
-    assert '4. test, msg warning, log INFO' in stderr
-    assert '4. test, msg error, log INFO' not in stderr
-    assert '4. test, msg warning, log WARNING' in stderr
-    assert '4. test, msg error, log WARNING' not in stderr
-    assert '4. test, msg error, log ERROR' in stderr
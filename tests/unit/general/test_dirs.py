@@ -13,7 +13,9 @@ Module Attributes:
 
 (C) Copyright 2021 Jonathan Casey.  All Rights Reserved Worldwide.
 """
+import functools
 import os.path
+import pathlib
 
 from asana_extensions.general import dirs
 
@@ -23,19 +25,19 @@ APP_NAME = 'asana_extensions'
 
 
 
+@functools.lru_cache(maxsize=1)
 def get_root_path():
     """
     Gets the root path of this repo (in an alternate path/method than would
     be done in asana_extensions.general.dirs) for use in tests.
 
+    Cached since this is resolved the same way for each test that needs it.
+
     Returns:
-      root_repo_dir (os.path): The absolute path to the repo root dir.
+      (str): The absolute path to the repo root dir.
     """
-    general_unit_test_dir = os.path.dirname(os.path.realpath(__file__))
-    unit_test_dir = os.path.dirname(general_unit_test_dir)
-    test_dir = os.path.dirname(unit_test_dir)
-    root_repo_dir = os.path.dirname(test_dir)
-    return root_repo_dir
+    # Parents are: general unit test dir, unit test dir, test dir, repo root dir
+    return str(pathlib.Path(__file__).resolve().parents[3])
 
 
 
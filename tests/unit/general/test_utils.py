@@ -8,7 +8,10 @@ with auto-discovery (others may exist, but will not be part of test suite
 directly).
 
 Module Attributes:
-  N/A
+  _RD_DATE (relativedelta): A relative delta that is a date only.
+  _RD_DATETIME (relativedelta): A relative delta that includes a time.
+  _ISO_DATE (str): An ISO 8601 string that is a date only.
+  _ISO_DATETIME (str): An ISO 8601 string that includes a time.
 
 (C) Copyright 2021 Jonathan Casey.  All Rights Reserved Worldwide.
 """
@@ -21,28 +24,35 @@ from asana_extensions.general import utils
 
 
 
-def test_is_date_only():
+_RD_DATE = relativedelta(days=1, months=2, years=3)
+_RD_DATETIME = relativedelta(days=1, seconds=2)
+_ISO_DATE = '2021-01-01'
+_ISO_DATETIME = '2021-01-01 00:00'
+
+
+
+@pytest.mark.parametrize('dt_var, expected', [
+    (_RD_DATE, True),
+    (_RD_DATETIME, False),
+    (_ISO_DATE, True),
+    (_ISO_DATETIME, False),
+])
+def test_is_date_only(dt_var, expected):
     """
     Tests the `is_date_only()` method.
     """
-    rd_date = relativedelta(days=1, months=2, years=3)
-    assert utils.is_date_only(rd_date) is True
-
-    rd_datetime = relativedelta(days=1, seconds=2)
-    assert utils.is_date_only(rd_datetime) is False
+    assert utils.is_date_only(dt_var) is expected
 
-    iso_date = '2021-01-01'
-    assert utils.is_date_only(iso_date) is True
 
-    iso_datetime = '2021-01-01 00:00'
-    assert utils.is_date_only(iso_datetime) is False
 
-    bad_str = 'this is only a date, trust me'
-    with pytest.raises(NotImplementedError) as ex:
-        utils.is_date_only(bad_str)
-    assert 'is not supported at this time:' in str(ex.value)
-
-    unsupported_dt_date = dt.date.today()
-    with pytest.raises(NotImplementedError) as ex:
-        utils.is_date_only(unsupported_dt_date)
-    assert 'is not supported at this time:' in str(ex.value)
+@pytest.mark.parametrize('dt_var', [
+    'this is only a date, trust me',
+    dt.date.today(),
+], ids=['bad_str', 'unsupported_dt_date'])
+def test_is_date_only__unsupported(dt_var):
+    """
+    Tests the `is_date_only()` method for types and formats not supported.
+    """
+    with pytest.raises(NotImplementedError,
+            match='is not supported at this time:'):
+        utils.is_date_only(dt_var)
@@ -14,42 +14,47 @@ from asana_extensions.rules import rule_meta
 
 
 
+class BlankRule(rule_meta.Rule):
+    """
+    Simple blank rule to subclass Rule.
+    """
+    @classmethod
+    def load_specific_from_conf(cls, rules_cp, rule_id, rule_params=None,
+            **kwargs):
+        """
+        Not needed / will not be used.
+        """
+        return
+
+    @classmethod
+    def get_rule_type_names(cls):
+        """
+        Not needed / will not be used.
+        """
+        return []
+
+    def _sync_and_validate_with_api(self):
+        """
+        Not needed / will not be used.
+        """
+        return True
+
+    def execute(self, force_test_report_only=False):
+        """
+        Not needed / will not be used.
+        """
+        return True
+
+
+
 @pytest.fixture(name='blank_rule_cls')
 def fixture_blank_rule_cls():
     """
     Returns a blank rule with default returns for all abstract methods.  This
     can be used as is in most cases; in most other cases, this can serve as a
     base with tests only needing to override individual methods via monkeypatch.
-    """
-    class BlankRule(rule_meta.Rule):
-        """
-        Simple blank rule to subclass Rule.
-        """
-        @classmethod
-        def load_specific_from_conf(cls, rules_cp, rule_id, rule_params=None,
-                **kwargs):
-            """
-            Not needed / will not be used.
-            """
-            return
-
-        @classmethod
-        def get_rule_type_names(cls):
-            """
-            Not needed / will not be used.
-            """
-            return []
-
-        def _sync_and_validate_with_api(self):
-            """
-            Not needed / will not be used.
-            """
-            return True
-
-        def execute(self, force_test_report_only=False):
-            """
-            Not needed / will not be used.
-            """
-            return True
 
+    The same class is returned to every test, so it must only be modified via
+    monkeypatch so that it is restored after each test.
+    """
     return BlankRule
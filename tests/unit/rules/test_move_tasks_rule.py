@@ -8,15 +8,27 @@ with auto-discovery (others may exist, but will not be part of test suite
 directly).
 
 Module Attributes:
-  N/A
+  _TEST_CONF_DIR (str): The path to the dir of the test config files.
+  _LOG_ERR_UTL_AND_GID ((str, int, str)): The log record tuple for a rule
+    failing to be created for giving both a user task list and its gid.
+  _LOG_ERR_PROJ_XOR_UTL ((str, int, str)): The log record tuple for a rule
+    failing to be created for not giving exactly one of a project or user task
+    list.
+  _LOG_ERR_NO_WORKSPACE ((str, int, str)): The log record tuple for a rule
+    failing to be created for not giving a workspace.
+  _LOG_ERR_TIME_UNTIL_PARSE ((str, int, str)): The log record tuple for a rule
+    failing to be created for min/max time until due not being parsed.
+  _LOG_ERR_TIME_UNTIL_XOR_NO_DUE ((str, int, str)): The log record tuple for a
+    rule failing to be created for not giving exactly one of min/max time until
+    due or match no due date.
 
 (C) Copyright 2021 Jonathan Casey.  All Rights Reserved Worldwide.
 """
 # pylint: disable=protected-access # Allow for purpose of testing those elements
 
-import copy
 import logging
 import os.path
+import types
 
 import asana
 import pytest
@@ -30,6 +42,54 @@ from tests.unit.rules import test_rule_meta
 
 
 
+_TEST_CONF_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+        'test_move_tasks_rule')
+
+_LOG_ERR_UTL_AND_GID = ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
+        'Failed to create Move Tasks Rule from config:'
+        + f' {move_tasks_rule.ERR_UTL_AND_GID}')
+
+_LOG_ERR_PROJ_XOR_UTL = ('asana_extensions.rules.move_tasks_rule',
+        logging.ERROR, 'Failed to create Move Tasks Rule from config:'
+        + f' {move_tasks_rule.ERR_PROJ_XOR_UTL}')
+
+_LOG_ERR_NO_WORKSPACE = ('asana_extensions.rules.move_tasks_rule',
+        logging.ERROR, 'Failed to create Move Tasks Rule from config:'
+        + f' {move_tasks_rule.ERR_NO_WORKSPACE}')
+
+_LOG_ERR_TIME_UNTIL_PARSE = ('asana_extensions.rules.move_tasks_rule',
+        logging.ERROR, 'Failed to create Move Tasks Rule from config:'
+        + f' {move_tasks_rule.ERR_TIME_UNTIL_PARSE}')
+
+_LOG_ERR_TIME_UNTIL_XOR_NO_DUE = ('asana_extensions.rules.move_tasks_rule',
+        logging.ERROR, 'Failed to create Move Tasks Rule from config:'
+        + f' {move_tasks_rule.ERR_TIME_UNTIL_XOR_NO_DUE}')
+
+
+
+@pytest.fixture(name='clean_caplog', autouse=True)
+def fixture_clean_caplog(caplog):
+    """
+    Starts each test with log capture at the warning level.  Tests that need a
+    different level can still set it themselves.
+    """
+    caplog.set_level(logging.WARNING)
+
+
+
+@pytest.fixture(name='rules_cp', scope='module')
+def fixture_rules_cp():
+    """
+    Reads the mock move tasks rules config once for all tests in this module.
+    Loading rules from it only reads from the parser, so it can be shared.
+
+    Returns:
+      (ConfigParser): The parser for the mock move tasks rules config.
+    """
+    return config.read_conf_file('mock_move_tasks_rules.conf', _TEST_CONF_DIR)
+
+
+
 @pytest.fixture(name='blank_move_tasks_rule')
 def fixture_blank_move_tasks_rule():
     """
@@ -72,7 +132,7 @@ def fixture_blank_move_tasks_rule():
 
 
 
-def test_load_specific_from_conf(caplog):  # pylint: disable=too-many-statements
+def test_load_specific_from_conf(caplog, rules_cp):
     """
     Tests the `load_specific_from_conf()` method in `MoveTasksRule`.
 
@@ -81,13 +141,6 @@ def test_load_specific_from_conf(caplog):  # pylint: disable=too-many-statements
     `load_specific_from_conf()` method, then a separate test for init should
     be added.
     """
-    this_dir = os.path.dirname(os.path.realpath(__file__))
-    conf_dir = os.path.join(this_dir, 'test_move_tasks_rule')
-    rules_cp = config.read_conf_file('mock_move_tasks_rules.conf', conf_dir)
-
-    caplog.set_level(logging.WARNING)
-
-    caplog.clear()
     rule = move_tasks_rule.MoveTasksRule.load_specific_from_conf(rules_cp,
             'test-move-tasks-success')
     assert rule is not None
@@ -103,136 +156,85 @@ def test_load_specific_from_conf(caplog):  # pylint: disable=too-many-statements
     ]
     assert rule._rule_params['src_sections_exclude_gids'] == [1]
 
+
+
+def test_load_specific_from_conf__rule_params(rules_cp):
+    """
+    Tests the `load_specific_from_conf()` method in `MoveTasksRule` fails if
+    any `rule_params` are passed in.
+    """
     with pytest.raises(AssertionError) as ex:
         move_tasks_rule.MoveTasksRule.load_specific_from_conf(rules_cp,
             'test-full', {'dummy key': 'dummy val'})
     assert "Should not pass anything in for `rule_params`" in str(ex.value)
 
-    caplog.clear()
-    rule = move_tasks_rule.MoveTasksRule.load_specific_from_conf(rules_cp,
-            'test-essential-missing-key')
-    assert rule is None
-    assert caplog.record_tuples == [
-            ('asana_extensions.rules.rule_meta', logging.ERROR,
-                "Failed to parse Rule from config.  Check keys.  Exception:"
-                + " 'rule type'"),
-            ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-                "Failed to parse Move Tasks Rule from config.  Check keys."
-                + "  Exception: 'rule type'"),
-    ]
 
-    caplog.clear()
-    rule = move_tasks_rule.MoveTasksRule.load_specific_from_conf(rules_cp,
-            'test-move-tasks-full')
-    assert rule is None
-    assert caplog.record_tuples == [
-            ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-                "Failed to create Move Tasks Rule from config:" \
-                    " Cannot specify 'for my tasks list' and" \
-                    + " 'user task list gid' together."),
-    ]
 
-    caplog.clear()
-    rule = move_tasks_rule.MoveTasksRule.load_specific_from_conf(rules_cp,
-            'test-invalid-boolean')
-    assert rule is None
-    assert caplog.record_tuples == [
-            ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-                "Failed to parse Move Tasks Rule from config.  Check strong"
-                + " typed values.  Exception: Not a boolean: 42"),
-    ]
-
-    caplog.clear()
-    rule = move_tasks_rule.MoveTasksRule.load_specific_from_conf(rules_cp,
-            'test-move-tasks-is-utl-and-gid')
-    assert rule is None
-    assert caplog.record_tuples == [
-            ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-                "Failed to create Move Tasks Rule from config:" \
-                    " Cannot specify 'for my tasks list' and" \
-                    + " 'user task list gid' together."),
-    ]
-
-    caplog.clear()
-    rule = move_tasks_rule.MoveTasksRule.load_specific_from_conf(rules_cp,
-            'test-move-tasks-no-proj-no-utl')
-    assert rule is None
-    assert caplog.record_tuples == [
-            ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-                "Failed to create Move Tasks Rule from config:"
-                + " Must specify to use a project or user task list, but not"
-                + " both."),
-    ]
-
-    caplog.clear()
-    rule = move_tasks_rule.MoveTasksRule.load_specific_from_conf(rules_cp,
-            'test-move-tasks-both-proj-and-utl')
-    assert rule is None
-    assert caplog.record_tuples == [
-            ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-                "Failed to create Move Tasks Rule from config:"
-                + " Must specify to use a project or user task list, but not"
-                + " both."),
-    ]
-
-    caplog.clear()
-    rule = move_tasks_rule.MoveTasksRule.load_specific_from_conf(rules_cp,
-            'test-move-tasks-no-workspace')
-    assert rule is None
-    assert caplog.record_tuples == [
-            ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-                "Failed to create Move Tasks Rule from config:"
-                + " Must specify workspace."),
-    ]
-
-    caplog.clear()
-    rule = move_tasks_rule.MoveTasksRule.load_specific_from_conf(rules_cp,
-                'test-move-tasks-timeframe-parse-fail')
-    assert rule is None
-    assert caplog.record_tuples == [
-            ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-                "Failed to parse Move Tasks Rule from config.  Check timeframe"
-                + " args.  Exception: Could not parse time frame - Found 2"
-                + " entries for minutes?/m when only 0-1 allowed."),
-    ]
-
-    caplog.clear()
-    rule = move_tasks_rule.MoveTasksRule.load_specific_from_conf(rules_cp,
-                'test-move-tasks-time-parse-fail')
-    assert rule is None
-    assert caplog.record_tuples == [
-            ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-                "Failed to parse Move Tasks Rule from config.  Check time args."
-                + "  Exception: Timezone prohibited for time string, but one was"
-                + " provided.  String: '12:23:45+00:00', parsed:"
-                + " `12:23:45+00:00`"),
-    ]
-
-    caplog.clear()
-    rule = move_tasks_rule.MoveTasksRule.load_specific_from_conf(rules_cp,
-            'test-move-tasks-both-time-until-and-no-due')
-    assert rule is None
-    assert caplog.record_tuples == [
-            ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-                "Failed to create Move Tasks Rule from config:"
-                + " Must specify either min/max time until due or match no" \
-                + " due date (but not both)."),
-    ]
-
-    caplog.clear()
+@pytest.mark.parametrize('rule_id, exp_record_tuples', [
+    ('test-essential-missing-key', [
+        ('asana_extensions.rules.rule_meta', logging.ERROR,
+            "Failed to parse Rule from config.  Check keys.  Exception:"
+            + " 'rule type'"),
+        ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
+            "Failed to parse Move Tasks Rule from config.  Check keys."
+            + "  Exception: 'rule type'"),
+    ]),
+    ('test-move-tasks-full', [
+        _LOG_ERR_UTL_AND_GID,
+    ]),
+    ('test-invalid-boolean', [
+        ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
+            "Failed to parse Move Tasks Rule from config.  Check strong"
+            + " typed values.  Exception: Not a boolean: 42"),
+    ]),
+    ('test-move-tasks-is-utl-and-gid', [
+        _LOG_ERR_UTL_AND_GID,
+    ]),
+    ('test-move-tasks-no-proj-no-utl', [
+        _LOG_ERR_PROJ_XOR_UTL,
+    ]),
+    ('test-move-tasks-both-proj-and-utl', [
+        _LOG_ERR_PROJ_XOR_UTL,
+    ]),
+    ('test-move-tasks-no-workspace', [
+        _LOG_ERR_NO_WORKSPACE,
+    ]),
+    ('test-move-tasks-timeframe-parse-fail', [
+        ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
+            "Failed to parse Move Tasks Rule from config.  Check timeframe"
+            + " args.  Exception: Could not parse time frame - Found 2"
+            + " entries for minutes?/m when only 0-1 allowed."),
+    ]),
+    ('test-move-tasks-time-parse-fail', [
+        ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
+            "Failed to parse Move Tasks Rule from config.  Check time args."
+            + "  Exception: Timezone prohibited for time string, but one was"
+            + " provided.  String: '12:23:45+00:00', parsed:"
+            + " `12:23:45+00:00`"),
+    ]),
+    ('test-move-tasks-both-time-until-and-no-due', [
+        _LOG_ERR_TIME_UNTIL_XOR_NO_DUE,
+    ]),
+    ('test-move-tasks-time-neither-time-until-nor-no-due', [
+        _LOG_ERR_TIME_UNTIL_XOR_NO_DUE,
+    ]),
+])
+def test_load_specific_from_conf__failures(caplog, rules_cp, rule_id,
+        exp_record_tuples):
+    """
+    Tests the `load_specific_from_conf()` method in `MoveTasksRule` for each of
+    the rules in the config that should fail to load, checking the errors
+    logged.
+    """
     rule = move_tasks_rule.MoveTasksRule.load_specific_from_conf(rules_cp,
-            'test-move-tasks-time-neither-time-until-nor-no-due')
+            rule_id)
     assert rule is None
-    assert caplog.record_tuples == [
-            ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-                "Failed to create Move Tasks Rule from config:"
-                + " Must specify either min/max time until due or match no" \
-                + " due date (but not both)."),
-    ]
+    assert caplog.record_tuples == exp_record_tuples
 
 
 
-def test_load_specific_from_conf__impossible(monkeypatch, caplog):
+def test_load_specific_from_conf__impossible(monkeypatch, caplog,
+        rules_cp):
     """
     Tests "impossible" cases in the `load_specific_from_conf()` method in
     `MoveTasksRule`.  These require mocking, as normally these are not possible
@@ -240,12 +242,6 @@ def test_load_specific_from_conf__impossible(monkeypatch, caplog):
     were to change in the future, this `load_specific_from_conf()` would still
     handle the situation.
     """
-    this_dir = os.path.dirname(os.path.realpath(__file__))
-    conf_dir = os.path.join(this_dir, 'test_move_tasks_rule')
-    rules_cp = config.read_conf_file('mock_move_tasks_rules.conf', conf_dir)
-
-    caplog.set_level(logging.WARNING)
-
     def mock_parse_timedelta_arg_pass(arg_str): # pylint: disable=unused-argument
         """
         Forces timedelta parser to return something.
@@ -255,15 +251,10 @@ def test_load_specific_from_conf__impossible(monkeypatch, caplog):
     monkeypatch.setattr(rule_meta.Rule, 'parse_timedelta_arg',
             mock_parse_timedelta_arg_pass)
 
-    caplog.clear()
     rule = move_tasks_rule.MoveTasksRule.load_specific_from_conf(rules_cp,
             'test-move-tasks-time-neither-time-until-nor-no-due')
     assert rule is None
-    assert caplog.record_tuples == [
-            ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-                "Failed to create Move Tasks Rule from config:"
-                + " Failed to parse min/max time until due -- check format."),
-    ]
+    assert caplog.record_tuples == [_LOG_ERR_TIME_UNTIL_PARSE]
 
 
     def mock_parse_timedelta_arg_fail(arg_str): # pylint: disable=unused-argument
@@ -279,11 +270,7 @@ def test_load_specific_from_conf__impossible(monkeypatch, caplog):
     rule = move_tasks_rule.MoveTasksRule.load_specific_from_conf(rules_cp,
             'test-move-tasks-time-parse-fake-fail')
     assert rule is None
-    assert caplog.record_tuples == [
-            ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-                "Failed to create Move Tasks Rule from config:"
-                + " Failed to parse min/max time until due -- check format."),
-    ]
+    assert caplog.record_tuples == [_LOG_ERR_TIME_UNTIL_PARSE]
 
 
 
@@ -292,226 +279,185 @@ def test_get_rule_type_names():
     Tests the `get_rule_type_names()` method in `MoveTasksRule`.  Not an
     exhaustive test.
     """
-    assert 'move tasks' in move_tasks_rule.MoveTasksRule.get_rule_type_names()
-    assert 'auto-promote tasks' \
-            in move_tasks_rule.MoveTasksRule.get_rule_type_names()
-    assert 'auto-promote' in move_tasks_rule.MoveTasksRule.get_rule_type_names()
-    assert 'auto promote tasks' \
-            in move_tasks_rule.MoveTasksRule.get_rule_type_names()
-    assert 'auto promote' in move_tasks_rule.MoveTasksRule.get_rule_type_names()
-    assert 'promote tasks' \
-            in move_tasks_rule.MoveTasksRule.get_rule_type_names()
-    assert 'not move tasks' \
-            not in move_tasks_rule.MoveTasksRule.get_rule_type_names()
+    names = set(move_tasks_rule.MoveTasksRule.get_rule_type_names())
+    assert {'move tasks', 'auto-promote tasks', 'auto-promote',
+            'auto promote tasks', 'auto promote', 'promote tasks'} <= names
+    assert 'not move tasks' not in names
 
 
 
-def test__sync_and_validate_with_api(      # pylint: disable=too-many-statements
-        monkeypatch, caplog, blank_move_tasks_rule):
+def mock_get_workspace_gid_from_name(ws_name, ws_gid=None):
+    """
+    Return the matching gid (if not triggering exception).
     """
-    Tests the `_sync_and_validate_with_api()` method in `MoveTasksRule`.
+    # pylint: disable=unused-argument
+    if ws_name == 'raise-client-creation-error':
+        raise aclient.ClientCreationError(ws_name)
+    return -102
 
-    The general design is to have mock functions that can return values to allow
-    the code to continue; but can pass in an alternative value to trigger an
-    exception.  Between all of the mock functions, all possible exceptions
-    caught by `_sync_and_validate_with_api()` are tested.
+
+
+def mock_get_user_task_list_gid(workspace_gid, is_me=False, user_gid=None):
     """
-    def mock_get_workspace_gid_from_name(ws_name, ws_gid=None):
-        """
-        Return the matching gid (if not triggering exception).
-        """
-        # pylint: disable=unused-argument
-        if ws_name == 'raise-client-creation-error':
-            raise aclient.ClientCreationError(ws_name)
-        return -102
+    Return the matching gid (if not triggering exception).
+    """
+    # pylint: disable=unused-argument
+    if workspace_gid == 'raise-asana-error':
+        raise asana.error.InvalidRequestError(workspace_gid)
+    return -104
 
-    def mock_get_user_task_list_gid(workspace_gid, is_me=False, user_gid=None):
-        """
-        Return the matching gid (if not triggering exception).
-        """
-        # pylint: disable=unused-argument
-        if workspace_gid == 'raise-asana-error':
-            raise asana.error.InvalidRequestError(workspace_gid)
-        return -104
 
-    def mock_get_project_gid_from_name(ws_gid, proj_name, proj_gid=None,
-            archived=False):
-        """
-        Return the matching gid (if not triggering exception).
-        """
-        # pylint: disable=unused-argument
-        if ws_gid == 'raise-data-not-found-error':
-            raise aclient.DataNotFoundError(ws_gid)
-        return -101
-
-    def mock_get_net_include_section_gids(proj_or_utl_gid,
-            include_sect_names=None, include_sect_gids=None,
-            exclude_sect_names=None, exclude_sect_gids=None,
-            default_to_include=True):
-        """
-        Return some gids (if not triggering exception).
-        """
-        # pylint: disable=unused-argument
-        if proj_or_utl_gid == 'raise-data-conflict-error':
-            raise autils.DataConflictError(proj_or_utl_gid)
-        if proj_or_utl_gid == 'raise-data-missing-error':
-            raise autils.DataMissingError(proj_or_utl_gid)
-        return [-105, -106]
-
-    def mock_get_section_gid_from_name(proj_or_utl_gid, sect_name,
-            sect_gid=None):
-        """
-        Return the matching gid (if not triggering exception).
-        """
-        # pylint: disable=unused-argument
-        if proj_or_utl_gid == 'raise-duplicate-name-error':
-            raise aclient.DuplicateNameError(proj_or_utl_gid)
-        if proj_or_utl_gid == 'raise-mismatched-data-error':
-            raise aclient.MismatchedDataError(proj_or_utl_gid)
-        return -103
-
-    monkeypatch.setattr(aclient, 'get_workspace_gid_from_name',
-            mock_get_workspace_gid_from_name)
-    monkeypatch.setattr(aclient, 'get_user_task_list_gid',
-            mock_get_user_task_list_gid)
-    monkeypatch.setattr(aclient, 'get_project_gid_from_name',
-            mock_get_project_gid_from_name)
-    monkeypatch.setattr(autils, 'get_net_include_section_gids',
-            mock_get_net_include_section_gids)
-    monkeypatch.setattr(aclient, 'get_section_gid_from_name',
-            mock_get_section_gid_from_name)
-
-    bmtr = blank_move_tasks_rule # Shorten name since used so much here
-
-    # All items are int/str/bool, so no need for deep copy
-    rule_params_backup = copy.copy(bmtr._rule_params)
-
-    def reset_rule_params():
-        """
-        Restore the rule params for the blank rule to the original/backup.
-        """
-        bmtr._rule_params = copy.copy(rule_params_backup)
 
-    caplog.set_level(logging.ERROR)
+def mock_get_project_gid_from_name(ws_gid, proj_name, proj_gid=None,
+        archived=False):
+    """
+    Return the matching gid (if not triggering exception).
+    """
+    # pylint: disable=unused-argument
+    if ws_gid == 'raise-data-not-found-error':
+        raise aclient.DataNotFoundError(ws_gid)
+    return -101
 
-    assert bmtr._sync_and_validate_with_api() is True
-    assert bmtr._rule_params['workspace_gid'] == -2
-    assert bmtr._rule_params['project_gid'] == -1
-    assert bmtr._rule_params['user_task_list_gid'] is None
-    assert bmtr._rule_params['effective_project_gid'] == -1
-    assert bmtr._rule_params['src_net_include_section_gids'] == [-105, -106]
-    assert bmtr._rule_params['dst_section_gid'] == -3
-
-    reset_rule_params()
-    bmtr._rule_params['workspace_name'] = 'test-ws'
-    bmtr._rule_params['project_name'] = 'test-proj'
-    bmtr._rule_params['dst_section_name'] = 'test-dst-sect'
-    assert bmtr._sync_and_validate_with_api() is True
-    assert bmtr._rule_params['workspace_gid'] == -102
-    assert bmtr._rule_params['project_gid'] == -101
-    assert bmtr._rule_params['user_task_list_gid'] is None
-    assert bmtr._rule_params['effective_project_gid'] == -101
-    assert bmtr._rule_params['src_net_include_section_gids'] == [-105, -106]
-    assert bmtr._rule_params['dst_section_gid'] == -103
-
-    reset_rule_params()
-    bmtr._rule_params['project_gid'] = None
-    bmtr._rule_params['is_my_tasks_list'] = True
-    assert bmtr._sync_and_validate_with_api() is True
-    assert bmtr._rule_params['workspace_gid'] == -2
-    assert bmtr._rule_params['project_gid'] is None
-    assert bmtr._rule_params['user_task_list_gid'] == -104
-    assert bmtr._rule_params['effective_project_gid'] == -104
-    assert bmtr._rule_params['src_net_include_section_gids'] == [-105, -106]
-    assert bmtr._rule_params['dst_section_gid'] == -3
-
-    reset_rule_params()
-    bmtr._rule_params['project_gid'] = None
-    bmtr._rule_params['user_task_list_gid'] = -4
-    assert bmtr._sync_and_validate_with_api() is True
-    assert bmtr._rule_params['workspace_gid'] == -2
-    assert bmtr._rule_params['project_gid'] is None
-    assert bmtr._rule_params['user_task_list_gid'] == -4
-    assert bmtr._rule_params['effective_project_gid'] == -4
-    assert bmtr._rule_params['src_net_include_section_gids'] == [-105, -106]
-    assert bmtr._rule_params['dst_section_gid'] == -3
-
-    msg_base_err  = 'Failed to sync and validate rule "blank rule id" with the'
-    msg_base_err += ' API.  Skipping rule.  Exception:'
 
-    caplog.clear()
-    reset_rule_params()
-    error = 'raise-client-creation-error'
-    bmtr._rule_params['workspace_name'] = error
-    assert bmtr._sync_and_validate_with_api() is False
-    assert caplog.record_tuples == [
-        ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-            f'{msg_base_err} {error}'),
-    ]
 
-    caplog.clear()
-    reset_rule_params()
-    error = 'raise-asana-error'
-    bmtr._rule_params['workspace_gid'] = error
-    bmtr._rule_params['project_gid'] = None
-    bmtr._rule_params['is_my_tasks_list'] = True
-    assert bmtr._sync_and_validate_with_api() is False
-    assert caplog.record_tuples == [
-        ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-            f'{msg_base_err} Invalid Request'),
-    ]
+def mock_get_net_include_section_gids(proj_or_utl_gid,
+        include_sect_names=None, include_sect_gids=None,
+        exclude_sect_names=None, exclude_sect_gids=None,
+        default_to_include=True):
+    """
+    Return some gids (if not triggering exception).
+    """
+    # pylint: disable=unused-argument
+    if proj_or_utl_gid == 'raise-data-conflict-error':
+        raise autils.DataConflictError(proj_or_utl_gid)
+    if proj_or_utl_gid == 'raise-data-missing-error':
+        raise autils.DataMissingError(proj_or_utl_gid)
+    return [-105, -106]
 
-    caplog.clear()
-    reset_rule_params()
-    error = 'raise-data-not-found-error'
-    bmtr._rule_params['workspace_gid'] = error
-    bmtr._rule_params['project_name'] = 'test-proj'
-    assert bmtr._sync_and_validate_with_api() is False
-    assert caplog.record_tuples == [
-        ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-            f'{msg_base_err} {error}'),
-    ]
 
-    caplog.clear()
-    reset_rule_params()
-    error = 'raise-data-conflict-error'
-    bmtr._rule_params['project_gid'] = error
-    assert bmtr._sync_and_validate_with_api() is False
-    assert caplog.record_tuples == [
-        ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-            f'{msg_base_err} {error}'),
-    ]
 
-    caplog.clear()
-    reset_rule_params()
-    error = 'raise-data-missing-error'
-    bmtr._rule_params['project_gid'] = error
-    assert bmtr._sync_and_validate_with_api() is False
-    assert caplog.record_tuples == [
-        ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-            f'{msg_base_err} {error}'),
-    ]
+def mock_get_section_gid_from_name(proj_or_utl_gid, sect_name,
+        sect_gid=None):
+    """
+    Return the matching gid (if not triggering exception).
+    """
+    # pylint: disable=unused-argument
+    if proj_or_utl_gid == 'raise-duplicate-name-error':
+        raise aclient.DuplicateNameError(proj_or_utl_gid)
+    if proj_or_utl_gid == 'raise-mismatched-data-error':
+        raise aclient.MismatchedDataError(proj_or_utl_gid)
+    return -103
 
-    caplog.clear()
-    reset_rule_params()
-    error = 'raise-duplicate-name-error'
-    bmtr._rule_params['project_gid'] = error
-    bmtr._rule_params['dst_section_name'] = 'test-dst-sect'
-    assert bmtr._sync_and_validate_with_api() is False
-    assert caplog.record_tuples == [
-        ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-            f'{msg_base_err} {error}'),
-    ]
 
-    caplog.clear()
-    reset_rule_params()
-    error = 'raise-mismatched-data-error'
-    bmtr._rule_params['project_gid'] = error
-    bmtr._rule_params['dst_section_name'] = 'test-dst-sect'
-    assert bmtr._sync_and_validate_with_api() is False
+
+@pytest.fixture(name='mock_sync_api', scope='module')
+def fixture_mock_sync_api():
+    """
+    Mocks all of the API functions used by `_sync_and_validate_with_api()` in
+    `MoveTasksRule`.
+
+    The general design is to have mock functions that can return values to allow
+    the code to continue; but can pass in an alternative value to trigger an
+    exception.  Between all of the mock functions, all possible exceptions
+    caught by `_sync_and_validate_with_api()` can be tested.  The mock functions
+    only depend on their args, so are defined once at module level.
+
+    The mocks are only set up once for all tests in this module that need them
+    (with their own monkeypatch since the `monkeypatch` fixture is function
+    scoped), so they remain in place for any tests in this module that follow.
+    This only ever mocks API functions in `aclient` and `autils` (never
+    anything of `MoveTasksRule` itself), which no test in this module may call
+    for real anyway, so this cannot change what any other test checks.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(aclient, 'get_workspace_gid_from_name',
+                mock_get_workspace_gid_from_name)
+        mp.setattr(aclient, 'get_user_task_list_gid',
+                mock_get_user_task_list_gid)
+        mp.setattr(aclient, 'get_project_gid_from_name',
+                mock_get_project_gid_from_name)
+        mp.setattr(autils, 'get_net_include_section_gids',
+                mock_get_net_include_section_gids)
+        mp.setattr(aclient, 'get_section_gid_from_name',
+                mock_get_section_gid_from_name)
+        yield
+
+
+
+@pytest.mark.usefixtures('mock_sync_api')
+@pytest.mark.parametrize('rule_params_update, exp_rule_params', [
+    ({}, {'workspace_gid': -2, 'project_gid': -1,
+            'user_task_list_gid': None, 'effective_project_gid': -1,
+            'dst_section_gid': -3}),
+    ({'workspace_name': 'test-ws', 'project_name': 'test-proj',
+            'dst_section_name': 'test-dst-sect'},
+        {'workspace_gid': -102, 'project_gid': -101,
+            'user_task_list_gid': None, 'effective_project_gid': -101,
+            'dst_section_gid': -103}),
+    ({'project_gid': None, 'is_my_tasks_list': True},
+        {'workspace_gid': -2, 'project_gid': None,
+            'user_task_list_gid': -104, 'effective_project_gid': -104,
+            'dst_section_gid': -3}),
+    ({'project_gid': None, 'user_task_list_gid': -4},
+        {'workspace_gid': -2, 'project_gid': None,
+            'user_task_list_gid': -4, 'effective_project_gid': -4,
+            'dst_section_gid': -3}),
+])
+def test__sync_and_validate_with_api(caplog, blank_move_tasks_rule,
+        rule_params_update, exp_rule_params):
+    """
+    Tests the `_sync_and_validate_with_api()` method in `MoveTasksRule` for
+    rules that sync and validate successfully.
+    """
+    blank_move_tasks_rule._rule_params.update(rule_params_update)
+
+    caplog.set_level(logging.ERROR)
+
+    assert blank_move_tasks_rule._sync_and_validate_with_api() is True
+    assert caplog.record_tuples == []
+    rule_params = blank_move_tasks_rule._rule_params
+    for key, exp_val in exp_rule_params.items():
+        assert rule_params[key] == exp_val
+    assert rule_params['src_net_include_section_gids'] == [-105, -106]
+
+
+
+@pytest.mark.usefixtures('mock_sync_api')
+@pytest.mark.parametrize('rule_params_update, exp_exc_msg', [
+    ({'workspace_name': 'raise-client-creation-error'},
+        'raise-client-creation-error'),
+    ({'workspace_gid': 'raise-asana-error', 'project_gid': None,
+            'is_my_tasks_list': True},
+        'Invalid Request'),
+    ({'workspace_gid': 'raise-data-not-found-error',
+            'project_name': 'test-proj'},
+        'raise-data-not-found-error'),
+    ({'project_gid': 'raise-data-conflict-error'},
+        'raise-data-conflict-error'),
+    ({'project_gid': 'raise-data-missing-error'},
+        'raise-data-missing-error'),
+    ({'project_gid': 'raise-duplicate-name-error',
+            'dst_section_name': 'test-dst-sect'},
+        'raise-duplicate-name-error'),
+    ({'project_gid': 'raise-mismatched-data-error',
+            'dst_section_name': 'test-dst-sect'},
+        'raise-mismatched-data-error'),
+])
+def test__sync_and_validate_with_api__errors(caplog, blank_move_tasks_rule,
+        rule_params_update, exp_exc_msg):
+    """
+    Tests the `_sync_and_validate_with_api()` method in `MoveTasksRule` for each
+    of the exceptions it catches, checking the error logged.
+    """
+    blank_move_tasks_rule._rule_params.update(rule_params_update)
+
+    caplog.set_level(logging.ERROR)
+
+    assert blank_move_tasks_rule._sync_and_validate_with_api() is False
     assert caplog.record_tuples == [
         ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
-            f'{msg_base_err} {error}'),
+            'Failed to sync and validate rule "blank rule id" with the API.'
+            + f'  Skipping rule.  Exception: {exp_exc_msg}'),
     ]
 
 
@@ -546,105 +492,93 @@ def test_is_criteria_met(blank_move_tasks_rule):
 
 
 
-def test_execute(                          # pylint: disable=too-many-statements
-        monkeypatch, caplog, blank_move_tasks_rule):
+def mock_is_valid(self):
     """
-    Tests the `execute()` method in `MoveTasksRule`.
+    Return True unless flagged to force to False.
     """
-    caplog.set_level(logging.INFO)
-    bmtr = blank_move_tasks_rule # Shorten name since used so much here
+    return not self._rule_params.get('mock_fail_is_valid', False)
 
-    def mock_is_valid(self):
-        """
-        Return True unless flagged to force to False.
-        """
-        if 'mock_fail_is_valid' in self._rule_params:
-            return False
-        return True
 
-    def mock_is_criteria_met(self):
-        """
-        Return True unless flagged to force to False.
-        """
-        if 'mock_fail_is_criteria_met' in self._rule_params:
-            return False
-        return True
 
-    def mock_get_filtered_tasks(section_gid, match_no_due_date=False,
+def mock_is_criteria_met(self):
+    """
+    Return True unless flagged to force to False.
+    """
+    return not self._rule_params.get('mock_fail_is_criteria_met', False)
+
+
+
+def mock_get_filtered_tasks(section_gid, match_no_due_date=False,
         min_time_until_due=None, max_time_until_due=None,
         min_time_due_assumed=None, max_time_due_assumed=None,
         is_completed=False, use_tzinfo=None, dt_base=None):
-        """
-        Return some varying task gids and/or raise errors.
-        """
-        # pylint: disable=unused-argument
-        if section_gid == -4:
-            return [{'name': 'ten', 'gid': -10}, {'name': 'eleven', 'gid': -11}]
-        if section_gid == -5:
-            return [{'name': 'twelve', 'gid': -12}]
-        if section_gid == -6:
-            return []
-        if section_gid == -7:
-            return [{'name': 'thirteen', 'gid': -13}]
-        if section_gid == -8:
-            return [{'name': 'fourteen', 'gid': -14}]
-        if section_gid == 'raise-asana-error':
-            raise asana.error.InvalidRequestError(section_gid)
-        if section_gid == 'raise-client-creation-error':
-            raise aclient.ClientCreationError(section_gid)
-        return None # Should not reach
-
-    def mock_move_task_to_section(task_gid, sect_gid, move_to_bottom=False):
-        """
-        Raise errors if certain task gids are passed in.
-        """
-        # pylint: disable=unused-argument
-        if task_gid == -13:
-            raise asana.error.InvalidRequestError('raise-asana-error')
-        if task_gid == -14:
-            raise aclient.ClientCreationError('raise-client-creation-error')
-
-    monkeypatch.setattr(move_tasks_rule.MoveTasksRule, 'is_valid',
-            mock_is_valid)
-    monkeypatch.setattr(move_tasks_rule.MoveTasksRule, 'is_criteria_met',
-            mock_is_criteria_met)
-    monkeypatch.setattr(autils, 'get_filtered_tasks', mock_get_filtered_tasks)
-    monkeypatch.setattr(aclient, 'move_task_to_section',
-            mock_move_task_to_section)
-
-    # All items are int/str/bool, so no need for deep copy
-    rule_params_backup = copy.copy(bmtr._rule_params)
-
-    def reset_rule_params():
-        """
-        Restore the rule params for the blank rule to the original/backup.
-        """
-        bmtr._rule_params = copy.copy(rule_params_backup)
+    """
+    Return some varying task gids and/or raise errors.
+    """
+    # pylint: disable=unused-argument
+    if section_gid == -4:
+        return [{'name': 'ten', 'gid': -10}, {'name': 'eleven', 'gid': -11}]
+    if section_gid == -5:
+        return [{'name': 'twelve', 'gid': -12}]
+    if section_gid == -6:
+        return []
+    if section_gid == -7:
+        return [{'name': 'thirteen', 'gid': -13}]
+    if section_gid == -8:
+        return [{'name': 'fourteen', 'gid': -14}]
+    if section_gid == 'raise-asana-error':
+        raise asana.error.InvalidRequestError(section_gid)
+    if section_gid == 'raise-client-creation-error':
+        raise aclient.ClientCreationError(section_gid)
+    return None # Should not reach
+
+
+
+def mock_move_task_to_section(task_gid, sect_gid, move_to_bottom=False):
+    """
+    Raise errors if certain task gids are passed in.
+    """
+    # pylint: disable=unused-argument
+    if task_gid == -13:
+        raise asana.error.InvalidRequestError('raise-asana-error')
+    if task_gid == -14:
+        raise aclient.ClientCreationError('raise-client-creation-error')
 
-    caplog.clear()
-    bmtr._rule_params['mock_fail_is_valid'] = True
-    assert bmtr.execute() is False
-    assert caplog.record_tuples == [
+
+
+@pytest.fixture(name='mock_execute_api', scope='module')
+def fixture_mock_execute_api():
+    """
+    Mocks all of the API functions used by `execute()` in `MoveTasksRule`.
+    These return varying tasks and/or raise errors depending on the section and
+    task gids passed in.
+
+    As with `mock_sync_api`, the mocks are only set up once for all tests in
+    this module that need them, so they remain in place for any tests in this
+    module that follow.  The validity and criteria checks of `MoveTasksRule`
+    are not mocked here since they are part of the class under test; each test
+    mocks those on its own rule instead.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(autils, 'get_filtered_tasks', mock_get_filtered_tasks)
+        mp.setattr(aclient, 'move_task_to_section', mock_move_task_to_section)
+        yield
+
+
+
+@pytest.mark.usefixtures('mock_execute_api')
+@pytest.mark.parametrize('rule_params_update, test_report_only,'
+        + ' force_test_report_only, exp_result, exp_record_tuples', [
+    ({'mock_fail_is_valid': True}, True, False, False, [
         ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
             'Failed to execute "blank rule id" since invalid.'),
-    ]
-
-    caplog.clear()
-    reset_rule_params()
-    bmtr._rule_params['mock_fail_is_criteria_met'] = True
-    assert bmtr.execute() is False
-    assert caplog.record_tuples == [
+    ]),
+    ({'mock_fail_is_criteria_met': True}, True, False, False, [
         ('asana_extensions.rules.move_tasks_rule', logging.INFO,
             'Skipping execution of "blank rule id" completely since criteria'
             + ' not met.'),
-    ]
-
-    caplog.clear()
-    reset_rule_params()
-    bmtr._rule_params['src_net_include_section_gids'] = [-4, -5, -6]
-    bmtr._test_report_only = False
-    assert bmtr.execute() is True
-    assert caplog.record_tuples == [
+    ]),
+    ({'src_net_include_section_gids': [-4, -5, -6]}, False, False, True, [
         ('asana_extensions.rules.move_tasks_rule', logging.INFO,
             'Successfully moved task "twelve" [-12] to section [-3] per'
                 + ' "blank rule id".'),
@@ -654,16 +588,9 @@ def test_execute(                          # pylint: disable=too-many-statements
         ('asana_extensions.rules.move_tasks_rule', logging.INFO,
             'Successfully moved task "ten" [-10] to section [-3] per'
                 + ' "blank rule id".'),
-    ]
-
-    caplog.clear()
-    reset_rule_params()
-    bmtr._rule_params['src_net_include_section_gids'] = \
-            [-8, -5, -6, 'raise-asana-error']
-    bmtr._rule_params['dst_section_name'] = 'test-dst-sect'
-    bmtr._test_report_only = False
-    assert bmtr.execute() is False
-    assert caplog.record_tuples == [
+    ]),
+    ({'src_net_include_section_gids': [-8, -5, -6, 'raise-asana-error'],
+            'dst_section_name': 'test-dst-sect'}, False, False, False, [
         ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
             'Failed to filter tasks for "blank rule id" in section'
                 + ' [raise-asana-error].  Skipping section.  Exception:'
@@ -675,15 +602,9 @@ def test_execute(                          # pylint: disable=too-many-statements
             'Failed to move task "fourteen" [-14] to section "test-dst-sect"'
                 + ' [-3] for "blank rule id".  Skipping task.  Exception:'
                 + ' raise-client-creation-error'),
-    ]
-
-    caplog.clear()
-    reset_rule_params()
-    bmtr._rule_params['src_net_include_section_gids'] = \
-            [-5, -7, 'raise-client-creation-error']
-    bmtr._test_report_only = False
-    assert bmtr.execute() is False
-    assert caplog.record_tuples == [
+    ]),
+    ({'src_net_include_section_gids': [-5, -7, 'raise-client-creation-error']},
+            False, False, False, [
         ('asana_extensions.rules.move_tasks_rule', logging.ERROR,
             'Failed to filter tasks for "blank rule id" in section'
                 + ' [raise-client-creation-error].  Skipping section.'
@@ -695,17 +616,33 @@ def test_execute(                          # pylint: disable=too-many-statements
         ('asana_extensions.rules.move_tasks_rule', logging.INFO,
             'Successfully moved task "twelve" [-12] to section [-3] per'
                 + ' "blank rule id".'),
-    ]
-
-    caplog.clear()
-    reset_rule_params()
-    bmtr._rule_params['src_net_include_section_gids'] = [-5]
-    bmtr._rule_params['dst_section_name'] = 'test-dst-sect'
-    bmtr._test_report_only = False
-    assert bmtr.execute(True) is True
-    assert caplog.record_tuples == [
+    ]),
+    ({'src_net_include_section_gids': [-5],
+            'dst_section_name': 'test-dst-sect'}, False, True, True, [
         ('asana_extensions.rules.move_tasks_rule', logging.INFO,
             '[Test Report Only] For MoveTasksRule "blank rule id", would have'
                 + ' moved task "twelve" [-12] to top of section "test-dst-sect"'
                 + ' [-3].'),
-    ]
+    ]),
+])
+def test_execute(monkeypatch, caplog, blank_move_tasks_rule,
+        rule_params_update, test_report_only, force_test_report_only,
+        exp_result, exp_record_tuples):
+    """
+    Tests the `execute()` method in `MoveTasksRule`.
+
+    The validity and criteria checks are mocked on the rule instance only (and
+    only for this test) so that they pass unless flagged to fail in the rule
+    params.
+    """
+    monkeypatch.setattr(blank_move_tasks_rule, 'is_valid',
+            types.MethodType(mock_is_valid, blank_move_tasks_rule))
+    monkeypatch.setattr(blank_move_tasks_rule, 'is_criteria_met',
+            types.MethodType(mock_is_criteria_met, blank_move_tasks_rule))
+    blank_move_tasks_rule._rule_params.update(rule_params_update)
+    blank_move_tasks_rule._test_report_only = test_report_only
+
+    caplog.set_level(logging.INFO)
+
+    assert blank_move_tasks_rule.execute(force_test_report_only) is exp_result
+    assert caplog.record_tuples == exp_record_tuples
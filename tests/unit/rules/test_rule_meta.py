@@ -8,7 +8,13 @@ with auto-discovery (others may exist, but will not be part of test suite
 directly).
 
 Module Attributes:
-  N/A
+  _TEST_CONF_DIR (str): The path to the dir of the test config files.
+  _TF_MINUTES, _TF_HOURS, _TF_DAYS, _TF_WEEKS, _TF_MONTHS, _TF_YEARS
+    ({str:bool}): The timeframe indicators used for each unit when testing
+    timeframe parsing, as would be passed to `parse_timeframe()`.
+  _TF_MULTI_LINE_STR (str): A timeframe string with one of each unit spread
+    over multiple lines, with each unit's value matching its position (e.g.
+    minutes is 1, years is 6).
 
 (C) Copyright 2021 Jonathan Casey.  All Rights Reserved Worldwide.
 """
@@ -27,6 +33,25 @@ from asana_extensions.rules import rule_meta
 
 
 
+_TEST_CONF_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+        'test_rule_meta')
+
+_TF_MINUTES = {'minutes?': False, 'm': True}
+_TF_HOURS = {'hours?': False, 'h': True}
+_TF_DAYS = {'days?': False, 'd': True}
+_TF_WEEKS = {'weeks?': False, 'w': True}
+_TF_MONTHS = {'months?': False, 'M': True}
+_TF_YEARS = {'years?': False, 'y': True}
+
+_TF_MULTI_LINE_STR = '''
+        1minute
+        2 hour
+        3Day
+        4w,5 mONths 6 y
+        '''
+
+
+
 def test_init(caplog, blank_rule_cls):
     """
     Tests `__init__()` method in `Rule`.
@@ -100,9 +125,7 @@ def test_load_specific_from_conf(caplog):
             """
             return True
 
-    this_dir = os.path.dirname(os.path.realpath(__file__))
-    conf_dir = os.path.join(this_dir, 'test_rule_meta')
-    rules_cp = config.read_conf_file('mock_rule_meta.conf', conf_dir)
+    rules_cp = config.read_conf_file('mock_rule_meta.conf', _TEST_CONF_DIR)
 
     caplog.set_level(logging.WARNING)
 
@@ -262,46 +285,71 @@ def test_parse_timedelta_arg():
 
 
 
-def test_parse_timeframe():
+@pytest.mark.parametrize('test_str, timeframe, expected', [
+    ('3m', _TF_MINUTES, 3),
+    ('3m', _TF_HOURS, 0),
+    ('-4minute', _TF_MINUTES, -4),
+    ('3h-4m+2M', _TF_MINUTES, -4),
+    ('3h-4m+2M', _TF_HOURS, 3),
+    ('3h-4m+2M', _TF_MONTHS, 2),
+    (_TF_MULTI_LINE_STR, _TF_MINUTES, 1),
+    (_TF_MULTI_LINE_STR, _TF_HOURS, 2),
+    (_TF_MULTI_LINE_STR, _TF_DAYS, 3),
+    (_TF_MULTI_LINE_STR, _TF_WEEKS, 4),
+    (_TF_MULTI_LINE_STR, _TF_MONTHS, 5),
+    (_TF_MULTI_LINE_STR, _TF_YEARS, 6),
+])
+def test_parse_timeframe(test_str, timeframe, expected):
     """
     Tests the `parse_timeframe()` method in `Rule`.
     """
-    tf_minutes = {'minutes?': False, 'm': True}
-    tf_hours = {'hours?': False, 'h': True}
-    tf_days = {'days?': False, 'd': True}
-    tf_weeks = {'weeks?': False, 'w': True}
-    tf_months = {'months?': False, 'M': True}
-    tf_years = {'years?': False, 'y': True}
-
-    test_str = '3m'
-    assert rule_meta.Rule.parse_timeframe(test_str, tf_minutes) == 3
-    assert rule_meta.Rule.parse_timeframe(test_str, tf_hours) == 0
-
-    test_str = '3m 2m'
-    with pytest.raises(TimeframeArgDupeError):
-        rule_meta.Rule.parse_timeframe(test_str, tf_minutes)
+    assert rule_meta.Rule.parse_timeframe(test_str, timeframe) == expected
+
 
-    test_str = '3m2m'
+
+@pytest.mark.parametrize('test_str', ['3m 2m', '3m2m'])
+def test_parse_timeframe__dupe(test_str):
+    """
+    Tests the `parse_timeframe()` method in `Rule` raises when a timeframe is
+    given more than once.
+    """
     with pytest.raises(TimeframeArgDupeError):
-        rule_meta.Rule.parse_timeframe(test_str, tf_minutes)
+        rule_meta.Rule.parse_timeframe(test_str, _TF_MINUTES)
+
 
-    test_str = '-4minute'
-    assert rule_meta.Rule.parse_timeframe(test_str, tf_minutes) == -4
+
+def test_parse_timeframes():
+    """
+    Tests the `parse_timeframes()` method in `Rule`.
+    """
+    timeframes_by_key = {
+        'minutes': _TF_MINUTES,
+        'hours': _TF_HOURS,
+        'days': _TF_DAYS,
+        'weeks': _TF_WEEKS,
+        'months': _TF_MONTHS,
+        'years': _TF_YEARS,
+    }
+
+    assert rule_meta.Rule.parse_timeframes(_TF_MULTI_LINE_STR,
+            timeframes_by_key) == {
+        'minutes': 1, 'hours': 2, 'days': 3, 'weeks': 4, 'months': 5,
+        'years': 6,
+    }
 
     test_str = '3h-4m+2M'
-    assert rule_meta.Rule.parse_timeframe(test_str, tf_minutes) == -4
-    assert rule_meta.Rule.parse_timeframe(test_str, tf_hours) == 3
-    assert rule_meta.Rule.parse_timeframe(test_str, tf_months) == 2
-
-    test_str = '''
-            1minute
-            2 hour
-            3Day
-            4w,5 mONths 6 y
-            '''
-    assert rule_meta.Rule.parse_timeframe(test_str, tf_minutes) == 1
-    assert rule_meta.Rule.parse_timeframe(test_str, tf_hours) == 2
-    assert rule_meta.Rule.parse_timeframe(test_str, tf_days) == 3
-    assert rule_meta.Rule.parse_timeframe(test_str, tf_weeks) == 4
-    assert rule_meta.Rule.parse_timeframe(test_str, tf_months) == 5
-    assert rule_meta.Rule.parse_timeframe(test_str, tf_years) == 6
+    assert rule_meta.Rule.parse_timeframes(test_str, timeframes_by_key) == {
+        'minutes': -4, 'hours': 3, 'days': 0, 'weeks': 0, 'months': 2,
+        'years': 0,
+    }
+
+    assert rule_meta.Rule.parse_timeframes('', timeframes_by_key) == {
+        'minutes': 0, 'hours': 0, 'days': 0, 'weeks': 0, 'months': 0,
+        'years': 0,
+    }
+
+    test_str = '3h 2d 1hours 4d'
+    with pytest.raises(TimeframeArgDupeError) as ex:
+        rule_meta.Rule.parse_timeframes(test_str, timeframes_by_key)
+    assert 'Found 2 entries for hours?/h when only 0-1 allowed.' \
+            in str(ex.value)
@@ -8,7 +8,7 @@ with auto-discovery (others may exist, but will not be part of test suite
 directly).
 
 Module Attributes:
-  N/A
+  _TEST_CONF_DIR (str): The path to the dir of the test config files.
 
 (C) Copyright 2021 Jonathan Casey.  All Rights Reserved Worldwide.
 """
@@ -24,6 +24,9 @@ from asana_extensions.rules import rules
 
 logger = logging.getLogger(__name__)
 
+_TEST_CONF_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+        'test_rules')
+
 
 
 def test_load_all_from_config(monkeypatch, caplog):
@@ -35,8 +38,7 @@ def test_load_all_from_config(monkeypatch, caplog):
         Overrides to point to mock configs dir path so reading config file will
         use this dir instead.
         """
-        return os.path.join(os.path.dirname(os.path.realpath(__file__)),
-            'test_rules')
+        return _TEST_CONF_DIR
 
     monkeypatch.setattr(dirs, 'get_conf_path', mock_get_conf_path)
 